@@ -0,0 +1,132 @@
+"""aiohttp front-end for the legacy server.py API.
+
+Same routes and responses as ``python server.py`` (static files from
+``public/`` plus ``POST /api``), but on aiohttp's event loop and C HTTP
+parser instead of ``http.server``. The blocking Firco flow runs on a thread
+pool so it never stalls the loop.
+
+Requires ``pip install aiohttp`` (``uvloop`` is picked up when installed);
+run with ``python aio_server.py``.
+"""
+
+import asyncio
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from aiohttp import web
+
+from server import (
+    CORS_HEADERS,
+    INCOMING_DIR,
+    OUTPUT_DIR,
+    MAX_BODY_BYTES,
+    REQUIRED_FIELDS,
+    STATIC_CACHE_MAX_BYTES,
+    PooledHTTPServer,
+    _get_cached,
+    _json,
+    handle_api_request,
+    resolve_static_path,
+    setup_logging,
+)
+from utils.browser_pool import shutdown_browser_pool, start_browser_pool
+
+# Same concurrency cap as the threaded server
+_API_POOL = ThreadPoolExecutor(
+    max_workers=PooledHTTPServer.max_workers, thread_name_prefix="api"
+)
+
+
+@web.middleware
+async def cors_middleware(request, handler):
+    """Answer CORS preflights and add the CORS headers to every response."""
+    if request.method == "OPTIONS":
+        return web.Response(headers=CORS_HEADERS)
+    try:
+        response = await handler(request)
+    except web.HTTPException as exc:
+        exc.headers.update(CORS_HEADERS)
+        raise
+    response.headers.update(CORS_HEADERS)
+    return response
+
+
+async def serve_static(request):
+    """Serve a file from public/, with the same cache/ETag/gzip rules as server.py."""
+    path = "/" + (request.match_info["path"] or "index.html")
+    file_path = resolve_static_path(path)
+    try:
+        st = os.stat(file_path) if file_path else None
+    except OSError:
+        st = None
+    if st is None or not os.path.isfile(file_path):
+        raise web.HTTPNotFound(text="File not found: " + path)
+
+    if st.st_size > STATIC_CACHE_MAX_BYTES:
+        return web.FileResponse(file_path)  # sendfile-backed streaming
+
+    entry = _get_cached(file_path, st)
+    if request.headers.get("If-None-Match") == entry.etag:
+        return web.Response(status=304, headers={"ETag": entry.etag})
+    if "gzip" in request.headers.get("Accept-Encoding", ""):
+        return web.Response(
+            body=entry.gzipped, headers={**entry.headers, "Content-Encoding": "gzip"}
+        )
+    return web.Response(body=entry.raw, headers=entry.headers)
+
+
+async def api(request):
+    """POST /api: validate the payload, then run the Firco flow off the event loop."""
+    try:
+        data = _json.loads(await request.read())
+    except ValueError:
+        return web.Response(status=400, text="Invalid JSON")
+    missing = REQUIRED_FIELDS.difference(data) if isinstance(data, dict) else REQUIRED_FIELDS
+    if missing:
+        return web.Response(
+            status=400, text=f'Missing required fields: {", ".join(sorted(missing))}'
+        )
+
+    loop = asyncio.get_running_loop()
+    response = await loop.run_in_executor(_API_POOL, handle_api_request, data)
+    return web.Response(body=_json.dumps(response), content_type="application/json")
+
+
+async def _on_cleanup(app):
+    _API_POOL.shutdown(wait=False)
+    shutdown_browser_pool()
+
+
+def make_app() -> web.Application:
+    # aiohttp answers 413 itself once a body exceeds client_max_size
+    app = web.Application(middlewares=[cors_middleware], client_max_size=MAX_BODY_BYTES)
+    app.router.add_post("/api", api)
+    app.router.add_get("/{path:.*}", serve_static)
+    app.on_cleanup.append(_on_cleanup)
+    return app
+
+
+def _install_uvloop() -> bool:
+    """Use uvloop (libuv, fewer syscalls per request) when it is installed."""
+    try:
+        import uvloop  # type: ignore[import-not-found]
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+def run(host: str = "0.0.0.0", port: int = 8088) -> None:
+    setup_logging()
+    if _install_uvloop():
+        logging.info("Using uvloop event loop")
+    os.makedirs(INCOMING_DIR, exist_ok=True)
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    start_browser_pool()
+    logging.info("Starting aiohttp server on %s:%s ...", host, port)
+    web.run_app(make_app(), host=host, port=port)
+
+
+if __name__ == "__main__":
+    run()
@@ -15,16 +15,17 @@ import os
 import tempfile
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from logging.handlers import RotatingFileHandler
 from typing import Any, Dict
 
 from flask import Flask, jsonify, request, send_from_directory, make_response
 from flask_cors import CORS  # third-party
-from playwright.sync_api import sync_playwright  # third-party
 from dotenv import load_dotenv  # third-party
 
 from firco.firco_page import FircoPage  # first-party
 from server import create_output_structure, move_screenshots_to_folder  # first-party
+from utils.browser_pool import run_in_browser, start_browser_pool  # first-party
 
 # Load environment variables from .env if present
 load_dotenv()
@@ -34,6 +35,13 @@ app = Flask(__name__, static_folder="public")
 # Enable CORS for all routes (development convenience)
 CORS(app, resources={r"/api/*": {"origins": "*"}}, supports_credentials=True)
 
+# Runs the items of /api/bpm/batch side by side; each search owns its own
+# Playwright session, as concurrent /api/bpm requests already do
+_BPM_BATCH_POOL = ThreadPoolExecutor(
+    max_workers=max(1, int(os.getenv("BPM_BATCH_WORKERS", "4"))),
+    thread_name_prefix="bpm-batch",
+)
+
 
 # ---------------------------------------------------------------------------
 # Logging Configuration
@@ -291,30 +299,15 @@ def process_api() -> Any:  # noqa: D401
     perform_on_latest = bool(data.get("performOnLatest", False))
 
     try:
-        # Run Playwright and use FircoPage directly
-        with sync_playwright() as p:
-            browser = p.chromium.launch(channel="chrome", headless=True)
-            context = browser.new_context()
-            page = context.new_page()
-
-            try:
-                firco = FircoPage(page)
-                response_dict = firco.flow_start(
-                    data["transaction"],
-                    data["action"],
-                    data["comment"],
-                    transaction_type,
-                )
-            finally:
-                # Ensure resources are closed
-                try:
-                    context.close()
-                except Exception:
-                    pass
-                try:
-                    browser.close()
-                except Exception:
-                    pass
+        # Run FircoPage on a pooled browser (fresh context per request)
+        response_dict = run_in_browser(
+            lambda page: FircoPage(page).flow_start(
+                data["transaction"],
+                data["action"],
+                data["comment"],
+                transaction_type,
+            )
+        )
 
         # Move screenshots if successful (or containing hits)
         transaction_folder, _ = create_output_structure(data["transaction"])
@@ -399,6 +392,15 @@ def process_bpm_search():
             400,
         )
 
+    return _run_bpm_search(data, request_id)
+
+
+def _run_bpm_search(data: Dict[str, Any], request_id: str):
+    """Validate one BPM search payload and run the automation.
+
+    Shared by `/api/bpm` and `/api/bpm/batch`. Returns a `(response, status)`
+    tuple ready to be returned from a Flask view.
+    """
     # Validate request body exists
     if not data:
         logging.warning("Empty request body received - ID: %s", request_id)
@@ -745,6 +747,55 @@ def process_bpm_search():
         )
 
 
+@app.route("/api/bpm/batch", methods=["POST", "OPTIONS"])
+def process_bpm_search_batch():
+    """Run several BPM searches from one request.
+
+    Expected JSON: {items: [{transactionId, marketType}, ...]}
+    The searches run concurrently (up to BPM_BATCH_WORKERS at a time).
+    Returns {status, results: [{httpStatus, data}, ...]} in the same order, so
+    clients that coalesce concurrent searches pay one HTTP round-trip.
+    """
+    if request.method == "OPTIONS":
+        return make_response("", 200)
+
+    request_id = f"req_{hash(str(request.data) + str(request.headers))}"
+    try:
+        payload = request.get_json(force=True)
+    except Exception:  # pylint: disable=broad-except
+        payload = None
+
+    items = payload.get("items") if isinstance(payload, dict) else None
+    if not isinstance(items, list) or not items:
+        return (
+            jsonify(
+                {
+                    "status": "error",
+                    "message": "Request body must be {\"items\": [...]} with at least one search.",
+                    "errorCode": "INVALID_BATCH",
+                    "requestId": request_id,
+                }
+            ),
+            400,
+        )
+
+    logging.info("BPM batch request - ID: %s, Items: %d", request_id, len(items))
+
+    def run_item(index, item):
+        # jsonify needs an app context, which worker threads do not have
+        with app.app_context():
+            resp, status_code = _run_bpm_search(
+                item if isinstance(item, dict) else {}, f"{request_id}_{index}"
+            )
+            return {"httpStatus": status_code, "data": resp.get_json()}
+
+    futures = [_BPM_BATCH_POOL.submit(run_item, i, item) for i, item in enumerate(items)]
+    # Collected in submission order, so results line up with items
+    results = [future.result() for future in futures]
+
+    return jsonify({"status": "ok", "results": results}), 200
+
+
 # Flask already serves static files when `static_folder` is configured.
 
 # ---------------------------------------------------------------------------
@@ -756,6 +807,7 @@ def main() -> None:  # pragma: no cover
     """Run the Flask app with thread support (development use)."""
     setup_logging()
     logging.info("Starting Flask server on http://0.0.0.0:8088 …")
+    start_browser_pool()
     app.run(host="0.0.0.0", port=8088, threaded=True)
 
 
@@ -9,6 +9,7 @@ class Settings(BaseSettings):
     # Global defaults
     DEFAULT_TIMEOUT: int = Field(60, description="Default HTTP timeout in seconds")
     RETRY_MAX: int = Field(3, description="Max retries for transient errors")
+    HTTP2: bool = Field(True, description="Negotiate HTTP/2 with the backend when it supports it")
 
     # BPM / Firco Flask service
     BPM_URL: Optional[AnyHttpUrl] = Field(
@@ -16,6 +17,12 @@ class Settings(BaseSettings):
     )
     BPM_USERNAME: Optional[str] = Field(default=None, description="Optional username for BPM system")
     BPM_PASSWORD: Optional[str] = Field(default=None, description="Optional password for BPM system")
+    BPM_BATCH_WINDOW_MS: float = Field(
+        0, description="Coalesce concurrent BPM searches into /api/bpm/batch within this window (0 disables)"
+    )
+
+    # Tool discovery: "manifest" imports tools.TOOL_MODULES, "walk" scans the package
+    TOOL_DISCOVERY: str = Field("manifest", description="Tool discovery mode: manifest or walk")
 
     # Debug
     LOG_LEVEL: str = Field("INFO", description="Logging level: DEBUG, INFO, WARNING, ERROR")
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 import json
-from typing import Any, Dict, Optional, Tuple
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import httpx
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
@@ -22,11 +24,50 @@ class ServiceAuth:
         return {}
 
 
+_client: Optional[httpx.AsyncClient] = None
+_ONE_US = timedelta(microseconds=1)
+# Read-only; copied only when a caller adds its own headers
+_JSON_HEADERS: Dict[str, str] = {"Content-Type": "application/json"}
+_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+
 def _timeout_for(service_timeout: Optional[int]) -> httpx.Timeout:
     seconds = service_timeout or settings.DEFAULT_TIMEOUT
     return httpx.Timeout(seconds)
 
 
+def get_shared_client() -> httpx.AsyncClient:
+    """Return the process-wide AsyncClient, creating it on first use.
+
+    Reusing one client keeps connections to the Flask backend alive between
+    tool calls instead of paying a fresh TCP handshake on every request.
+    With HTTP2 enabled, concurrent calls to an HTTPS backend that negotiates
+    h2 share one multiplexed connection; plain http:// stays on HTTP/1.1.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=_timeout_for(None),
+            follow_redirects=True,
+            # With a custom transport httpx ignores the client's http2/limits,
+            # so they have to be set on the transport itself
+            transport=httpx.AsyncHTTPTransport(
+                retries=0,
+                http2=settings.HTTP2,
+                limits=_LIMITS,
+            ),
+        )
+    return _client
+
+
+async def aclose_shared_client() -> None:
+    """Close the shared client (called on server shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
 @retry(
     reraise=True,
     stop=stop_after_attempt(settings.RETRY_MAX),
@@ -40,25 +81,136 @@ async def request_json(
     json_body: Optional[Dict[str, Any]] = None,
     headers: Optional[Dict[str, str]] = None,
     timeout_seconds: Optional[int] = None,
-) -> Tuple[Dict[str, Any], int, float]:
-    """Perform an HTTP request and return (json_or_error, status_code, elapsed_ms).
+) -> Tuple[Dict[str, Any], int, int]:
+    """Perform an HTTP request and return (json_or_error, status_code, elapsed_us).
+
+    `elapsed_us` is the round-trip time in integer microseconds.
 
-    If the response body is not JSON, returns a normalized error payload.
+    The payload is always a dict: non-JSON bodies and non-object JSON are
+    returned as a normalized error payload.
     """
     timeout = _timeout_for(timeout_seconds)
-    merged_headers = {"Content-Type": "application/json"}
-    if headers:
-        merged_headers.update(headers)
+    merged_headers = {**_JSON_HEADERS, **headers} if headers else _JSON_HEADERS
+
+    client = get_shared_client()
+    resp = await client.request(
+        method.upper(), url, json=json_body, headers=merged_headers, timeout=timeout
+    )
+    elapsed_us = resp.elapsed // _ONE_US
+    try:
+        data = resp.json()
+    except json.JSONDecodeError:
+        data = {
+            "status": "error",
+            "message": "Non-JSON response",
+            "raw": resp.text[:2000],
+        }
+    if not isinstance(data, dict):
+        # Tools rely on always receiving a dict envelope
+        data = {
+            "status": "error",
+            "message": "Unexpected non-dict JSON response",
+            "raw": str(data)[:500],
+        }
+    return data, resp.status_code, elapsed_us
+
+
+Result = Tuple[Dict[str, Any], int, int]
+
 
-    async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
-        resp = await client.request(method.upper(), url, json=json_body, headers=merged_headers)
-        elapsed_ms = resp.elapsed.total_seconds() * 1000.0
+class MicroBatcher:
+    """Coalesce concurrent POSTs to one endpoint into a single batch request.
+
+    Calls submitted within `window_ms` of each other (up to `max_batch`) are
+    sent together as {"items": [...]} to `batch_url`, and the backend's
+    {"results": [{"httpStatus", "data"}, ...]} is split back per caller.
+    A lone call goes straight to `url`. If the backend has no batch route
+    (404/405), the batcher sticks to per-item requests from then on.
+    """
+
+    def __init__(self, url: str, batch_url: str, *, window_ms: float = 5.0, max_batch: int = 16) -> None:
+        self.url = url
+        self.batch_url = batch_url
+        self.window = window_ms / 1000.0
+        self.max_batch = max_batch
+        self._pending: List[Tuple[Dict[str, Any], Optional[int], "asyncio.Future[Result]"]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set["asyncio.Task[None]"] = set()
+        self._batch_supported = True
+
+    async def submit(self, body: Dict[str, Any], timeout_seconds: Optional[int] = None) -> Result:
+        if not self._batch_supported:
+            return await request_json("POST", self.url, json_body=body, timeout_seconds=timeout_seconds)
+
+        loop = asyncio.get_running_loop()
+        fut: "asyncio.Future[Result]" = loop.create_future()
+        self._pending.append((body, timeout_seconds, fut))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window, self._flush)
+        return await fut
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._send(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch: List[Tuple[Dict[str, Any], Optional[int], "asyncio.Future[Result]"]]) -> None:
+        if len(batch) == 1 or not self._batch_supported:
+            await self._send_each(batch)
+            return
+
+        timeouts = [t for _, t, _ in batch if t]
         try:
-            data = resp.json()
-        except json.JSONDecodeError:
-            data = {
-                "status": "error",
-                "message": "Non-JSON response",
-                "raw": resp.text[:2000],
-            }
-        return data, resp.status_code, elapsed_ms
+            data, status, elapsed_us = await request_json(
+                "POST",
+                self.batch_url,
+                json_body={"items": [body for body, _, _ in batch]},
+                timeout_seconds=max(timeouts) if timeouts else None,
+            )
+        except Exception as exc:
+            for _, _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(exc)
+            return
+
+        if status in (404, 405):
+            self._batch_supported = False
+            logger.info("Batch endpoint unavailable; sending requests individually", url=self.batch_url)
+            await self._send_each(batch)
+            return
+
+        results = data.get("results")
+        if status >= 400 or not isinstance(results, list) or len(results) != len(batch):
+            # Batch-level failure: every caller gets its own copy of the error envelope
+            for _, _, fut in batch:
+                if not fut.done():
+                    fut.set_result((dict(data), status, elapsed_us))
+            return
+
+        for (_, _, fut), item in zip(batch, results):
+            item_data = item.get("data") if isinstance(item, dict) else None
+            item_status = item.get("httpStatus", status) if isinstance(item, dict) else status
+            if not isinstance(item_data, dict):
+                item_data = {"status": "error", "message": "Malformed batch item", "raw": str(item)[:500]}
+            if not fut.done():
+                fut.set_result((item_data, item_status, elapsed_us))
+
+    async def _send_each(self, batch: List[Tuple[Dict[str, Any], Optional[int], "asyncio.Future[Result]"]]) -> None:
+        outcomes = await asyncio.gather(
+            *(request_json("POST", self.url, json_body=body, timeout_seconds=t) for body, t, _ in batch),
+            return_exceptions=True,
+        )
+        for (_, _, fut), outcome in zip(batch, outcomes):
+            if fut.done():
+                continue
+            if isinstance(outcome, BaseException):
+                fut.set_exception(outcome)
+            else:
+                fut.set_result(outcome)
@@ -1,39 +1,113 @@
 from __future__ import annotations
 
+import atexit
 import logging as _stdlib_logging
+import logging.handlers as _stdlib_handlers
+import queue
 import sys
-from typing import Any
+from typing import Any, Dict, Optional
 
+import orjson
 import structlog
 
+_LOGGER_CACHE: Dict[Optional[str], Any] = {}
+_listener: Optional[_stdlib_handlers.QueueListener] = None
+
+
+class _QueueFile:
+    """Minimal bytes file for structlog's BytesLogger that enqueues lines.
+
+    Lines are wrapped in LogRecords and written to stderr by the same
+    QueueListener thread that drains stdlib logging.
+    """
+
+    def __init__(self, q: "queue.SimpleQueue[Any]") -> None:
+        self._q = q
+
+    def write(self, data: bytes) -> None:
+        self._q.put_nowait(_stdlib_logging.makeLogRecord({"msg": data.decode().rstrip("\n")}))
+
+    def flush(self) -> None:
+        pass
+
+
+_QUEUE: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+_QUEUE_FILE = _QueueFile(_QUEUE)
+
 
 def setup_logging(level: str = "INFO") -> None:
     """Configure structlog and stdlib logging for JSON-ish logs safe for STDIO.
 
     Important for MCP stdio servers: avoid printing raw text to stdout; use logging.
+    App loggers render with orjson; stdlib logging is kept only for third-party
+    libraries. Both are queued and written to stderr by a background thread so
+    the event loop never blocks on stderr.
     """
+    global _listener
+    level_no = getattr(_stdlib_logging, level.upper(), _stdlib_logging.INFO)
+
     processors = [
         structlog.processors.TimeStamper(fmt="iso", key="ts"),
         structlog.processors.add_log_level,
-        structlog.processors.StackInfoRenderer(),
+    ]
+    # stack_info rendering is only wanted while debugging
+    if level_no <= _stdlib_logging.DEBUG:
+        processors.append(structlog.processors.StackInfoRenderer())
+    processors += [
+        # Cheap unless exc_info is passed (e.g. registry import failures)
         structlog.processors.format_exc_info,
-        structlog.processors.JSONRenderer(),
+        structlog.processors.JSONRenderer(serializer=orjson.dumps),
     ]
 
     structlog.configure(
         processors=processors,
-        logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
+        logger_factory=structlog.BytesLoggerFactory(file=_QUEUE_FILE),
+        wrapper_class=structlog.make_filtering_bound_logger(level_no),
         cache_logger_on_first_use=True,
     )
 
+    # Third-party libraries (httpx, mcp, ...) still log via stdlib
     root = _stdlib_logging.getLogger()
     root.handlers.clear()
     handler = _stdlib_logging.StreamHandler(sys.stderr)
     handler.setFormatter(_stdlib_logging.Formatter("%(message)s"))
-    root.addHandler(handler)
-    root.setLevel(getattr(_stdlib_logging, level.upper(), _stdlib_logging.INFO))
+    root.addHandler(_stdlib_handlers.QueueHandler(_QUEUE))
+    root.setLevel(level_no)
+
+    # One queue and listener for the life of the process: loggers cached
+    # before a reconfigure still write to _QUEUE_FILE, so only the output
+    # handler is swapped (a single attribute store the listener thread reads
+    # per record) and nothing already queued is dropped
+    if _listener is None:
+        _listener = _stdlib_handlers.QueueListener(_QUEUE, handler, respect_handler_level=False)
+        _listener.start()
+    else:
+        _listener.handlers = (handler,)
+
+    # Loggers bound before this call would carry the old configuration
+    _LOGGER_CACHE.clear()
+
+
+def _stop_listener() -> None:
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(_stop_listener)
 
 
 def get_logger(name: str | None = None) -> Any:
-    return structlog.get_logger(name)
+    """Return a bound logger for `name`, materialized once and cached.
+
+    Before `setup_logging` runs, the lazy structlog proxy is returned so that
+    import-time loggers pick up the final configuration on first use.
+    """
+    if not structlog.is_configured():
+        return structlog.get_logger(name)
+    lg = _LOGGER_CACHE.get(name)
+    if lg is None:
+        lg = structlog.get_logger(name).bind()
+        _LOGGER_CACHE[name] = lg
+    return lg
@@ -3,34 +3,48 @@ from __future__ import annotations
 import importlib
 import pkgutil
 from types import ModuleType
-from typing import Callable, Optional
+from typing import Callable, Optional, Set
 
+from .config import settings
 from .logging import get_logger
 
 logger = get_logger(__name__)
 
 
-def autodiscover_and_register(package: str, mcp_instance) -> None:
+def autodiscover_and_register(package: str, mcp_instance, seen: Optional[Set[str]] = None) -> None:
     """Import all submodules in `package` and call their `register(mcp)` if present.
 
     This keeps tool modules self-contained while allowing dynamic registration.
+    Modules already listed in `seen` are skipped so a tool is never registered twice.
+    If the package declares a `TOOL_MODULES` manifest it is used as-is; the
+    pkgutil walk is only a fallback (or forced with TOOL_DISCOVERY=walk).
     """
+    if seen is None:
+        seen = set()
     pkg = importlib.import_module(package)
-    if not hasattr(pkg, "__path__"):
+    manifest = getattr(pkg, "TOOL_MODULES", None)
+    if manifest is not None and settings.TOOL_DISCOVERY != "walk":
+        names = manifest
+    elif hasattr(pkg, "__path__"):
+        names = [name for _, name, _ in pkgutil.walk_packages(pkg.__path__, pkg.__name__ + ".")]
+    else:
         logger.warning("Package %s has no __path__ for discovery", package)
         return
 
-    for finder, name, ispkg in pkgutil.walk_packages(pkg.__path__, pkg.__name__ + "."):
+    for name in names:
         try:
             mod = importlib.import_module(name)
-            _register_module(mod, mcp_instance)
+            _register_module(mod, mcp_instance, seen)
         except Exception as exc:  # pragma: no cover
             # Include traceback to diagnose issues like type inspection errors on some platforms
             logger.error("Failed importing tool module %s: %s", name, exc, exc_info=True)
 
 
-def _register_module(mod: ModuleType, mcp_instance) -> None:
+def _register_module(mod: ModuleType, mcp_instance, seen: Set[str]) -> None:
+    if mod.__name__ in seen:
+        return
     register: Optional[Callable] = getattr(mod, "register", None)
     if callable(register):
+        seen.add(mod.__name__)
         register(mcp_instance)
         logger.info("Registered tools from module", module=mod.__name__)
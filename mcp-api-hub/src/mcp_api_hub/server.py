@@ -1,19 +1,47 @@
 from __future__ import annotations
 
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from mcp.server.fastmcp import FastMCP
 
 from .config import settings
+from .http_client import aclose_shared_client
 from .logging import setup_logging, get_logger
 from .registry import autodiscover_and_register
 
 
+@asynccontextmanager
+async def _lifespan(_server: FastMCP) -> AsyncIterator[None]:
+    # Release pooled backend connections when the stdio session ends
+    try:
+        yield
+    finally:
+        await aclose_shared_client()
+
+
+def _install_uvloop() -> bool:
+    """Use uvloop for the asyncio event loop when it is installed (optional extra)."""
+    try:
+        import uvloop  # type: ignore[import-not-found]
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
 def main() -> None:
     # Load environment and configure logging early
     setup_logging(settings.LOG_LEVEL)
     log = get_logger(__name__)
 
+    # Must happen before FastMCP starts its event loop
+    if _install_uvloop():
+        log.info("Using uvloop event loop")
+
     # Initialize MCP server
-    mcp = FastMCP(name="mcp-api-hub")
+    mcp = FastMCP(name="mcp-api-hub", lifespan=_lifespan)
 
     # Autodiscover and register tools
     autodiscover_and_register("mcp_api_hub.tools", mcp)
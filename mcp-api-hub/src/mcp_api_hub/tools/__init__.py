@@ -1,2 +1,9 @@
 # Tool modules live here. Each module should expose a `register(mcp)` function
 # that decorates and registers tools on the provided FastMCP instance.
+#
+# New tool modules must be added to TOOL_MODULES; the registry imports them
+# from this manifest instead of walking the package on startup.
+TOOL_MODULES: tuple = (
+    "mcp_api_hub.tools.bpm",
+    "mcp_api_hub.tools.firco",
+)
@@ -1,82 +1,89 @@
+import functools
 from typing import Optional, Dict, Any
 
-from pydantic import BaseModel, Field
-import pydantic as _pyd
+from pydantic import BaseModel, Field, model_validator
+from pydantic import StringConstraints
+from typing_extensions import Annotated
 
-# Pydantic v1/v2 compatible constrained string aliases
-try:  # v2 path
-    _V_MAJOR = int(getattr(_pyd, "VERSION", "2").split(".")[0])
-except Exception:  # pragma: no cover - defensive
-    _V_MAJOR = 2
+from ..config import settings
+from ..http_client import MicroBatcher, request_json
+from ..logging import get_logger
 
-if _V_MAJOR >= 2:  # Pydantic v2
-    from pydantic import StringConstraints  # type: ignore
-    from typing_extensions import Annotated  # Py3.10 compat
 
-    Str_3_50_ws = Annotated[str, StringConstraints(strip_whitespace=True, min_length=3, max_length=50)]
-    Str_1p_ws = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
-else:  # Pydantic v1
-    from pydantic import constr  # type: ignore
+def _log():
+    # Looked up per call: get_logger caches per name and drops stale loggers
+    # when setup_logging reconfigures
+    return get_logger(__name__)
 
-    Str_3_50_ws = constr(strip_whitespace=True, min_length=3, max_length=50)  # type: ignore
-    Str_1p_ws = constr(strip_whitespace=True, min_length=1)  # type: ignore
 
-from ..config import settings
-from ..http_client import request_json
-from ..logging import get_logger
+# Shared across calls; request_json never mutates the headers it is given
+_NO_HEADERS: Dict[str, str] = {}
+_ENDPOINT = "/api/bpm"
 
-log = get_logger(__name__)
+Str_3_50 = Annotated[str, StringConstraints(min_length=3, max_length=50)]
+Str_1p = Annotated[str, StringConstraints(min_length=1)]
 
 
 class BpmRequest(BaseModel):
-    transactionId: Str_3_50_ws
-    marketType: Str_1p_ws
+    transactionId: Str_3_50
+    marketType: Str_1p
     timeoutSeconds: Optional[int] = Field(
         default=None, description="Override timeout for this call in seconds"
     )
 
+    @model_validator(mode="before")
+    @classmethod
+    def _strip(cls, values: Any) -> Any:
+        # One pass over the payload instead of a strip processor per field
+        if isinstance(values, dict):
+            return {k: v.strip() if isinstance(v, str) else v for k, v in values.items()}
+        return values
+
 
-def _bpm_base_url() -> str:
-    return (settings.BPM_URL or "http://localhost:8088").rstrip("/")
+@functools.cache
+def _bpm_url() -> str:
+    base = str(settings.BPM_URL or "http://localhost:8088").rstrip("/")
+    return f"{base}{_ENDPOINT}"
+
+
+@functools.cache
+def _bpm_batcher() -> Optional[MicroBatcher]:
+    if settings.BPM_BATCH_WINDOW_MS <= 0:
+        return None
+    return MicroBatcher(_bpm_url(), f"{_bpm_url()}/batch", window_ms=settings.BPM_BATCH_WINDOW_MS)
 
 
 def register(mcp) -> None:
     @mcp.tool()
-    async def bpm_search_tool(payload: dict) -> dict:
+    async def bpm_search_tool(payload: BpmRequest) -> dict:
         """Search BPM for a transaction.
         
         Calls the local Flask endpoint `/api/bpm` with JSON body {transactionId, marketType}.
         Returns backend JSON with added _clientMeta. Sets isError when HTTP>=400 or status=='error'.
         """
-        # Validate and normalize input using Pydantic v2
-        req = BpmRequest.model_validate(payload)
-
-        url = f"{_bpm_base_url()}/api/bpm"
-        body = {"transactionId": req.transactionId, "marketType": req.marketType}
-
-        headers: Dict[str, str] = {}
-
-        data, status, elapsed_ms = await request_json(
-            "POST",
-            url,
-            json_body=body,
-            headers=headers,
-            timeout_seconds=req.timeoutSeconds,
-        )
+        url = _bpm_url()
+        body = {"transactionId": payload.transactionId, "marketType": payload.marketType}
+        # Filtering bound logger: debug() is a no-op method unless LOG_LEVEL=DEBUG
+        _log().debug("bpm_search_tool request", **body)
+
+        batcher = _bpm_batcher()
+        if batcher is not None:
+            data, status, elapsed_us = await batcher.submit(body, payload.timeoutSeconds)
+        else:
+            data, status, elapsed_us = await request_json(
+                "POST",
+                url,
+                json_body=body,
+                headers=_NO_HEADERS,
+                timeout_seconds=payload.timeoutSeconds,
+            )
 
         # Normalize envelope
-        is_error = status >= 400 or (isinstance(data, dict) and data.get("status") == "error")
-        meta = {"endpoint": "/api/bpm", "httpStatus": status, "elapsedMs": round(elapsed_ms, 2)}
-
-        if isinstance(data, dict):
-            data.setdefault("_clientMeta", meta)
-            data.setdefault("isError", is_error)
-            return data
-        else:  # pragma: no cover - defensive
-            return {
-                "status": "error" if is_error else "ok",
-                "message": "Unexpected non-dict response from BPM endpoint",
-                "raw": str(data)[:500],
-                "_clientMeta": meta,
-                "isError": True,
-            }
+        is_error = status >= 400 or data.get("status") == "error"
+
+        # Only build the meta dict when the backend did not supply one
+        if "_clientMeta" not in data:
+            data["_clientMeta"] = {"endpoint": _ENDPOINT, "httpStatus": status, "elapsedMs": round(elapsed_us / 1000, 2)}
+        if "isError" not in data:
+            data["isError"] = is_error
+        return data
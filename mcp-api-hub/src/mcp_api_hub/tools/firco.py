@@ -1,6 +1,7 @@
+import functools
 from typing import Optional, Dict, Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from pydantic import StringConstraints
 from typing_extensions import Annotated
 
@@ -8,69 +9,75 @@ from ..config import settings
 from ..http_client import request_json
 from ..logging import get_logger
 
-log = get_logger(__name__)
+
+def _log():
+    # Looked up per call: get_logger caches per name and drops stale loggers
+    # when setup_logging reconfigures
+    return get_logger(__name__)
+
+
+# Reused for every call (request_json treats headers as read-only)
+_NO_HEADERS: Dict[str, str] = {}
+_ENDPOINT = "/api"
 
 
 class FircoRequest(BaseModel):
-    transaction: Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
-    action: Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
-    comment: Annotated[str, StringConstraints(strip_whitespace=True)] = ""
+    transaction: Annotated[str, StringConstraints(min_length=1)]
+    action: Annotated[str, StringConstraints(min_length=1)]
+    comment: str = ""
     transactionType: Optional[str] = Field(default="", description="Optional transaction type")
     performOnLatest: Optional[bool] = Field(default=False, description="If true, perform action on the latest")
     timeoutSeconds: Optional[int] = Field(
         default=None, description="Override timeout for this call in seconds"
     )
 
+    @model_validator(mode="before")
+    @classmethod
+    def _strip(cls, values: Any) -> Any:
+        # Strip every string field up front so the constraints see trimmed values
+        if isinstance(values, dict):
+            return {k: v.strip() if isinstance(v, str) else v for k, v in values.items()}
+        return values
+
 
-def _base_url() -> str:
+@functools.cache
+def _firco_url() -> str:
     # Reuse BPM_URL default since both are served by the same Flask app by default
-    return (settings.BPM_URL or "http://localhost:8088").rstrip("/")
+    base = str(settings.BPM_URL or "http://localhost:8088").rstrip("/")
+    return f"{base}{_ENDPOINT}"
 
 
 def register(mcp) -> None:
     @mcp.tool()
-    async def firco_process_tool(payload: dict) -> dict:
+    async def firco_process_tool(payload: FircoRequest) -> dict:
         """Execute a Firco automation via the Flask `/api` endpoint.
         
         Expects {transaction, action, comment, transactionType?, performOnLatest?} and forwards them.
         Returns backend JSON with `_clientMeta` and `isError` normalization.
         """
-        # Validate and normalize input with Pydantic v2
-        req = FircoRequest.model_validate(payload)
-
-        url = f"{_base_url()}/api"
+        url = _firco_url()
         body = {
-            "transaction": req.transaction,
-            "action": req.action,
-            "comment": req.comment,
-            "transactionType": req.transactionType or "",
-            "performOnLatest": bool(req.performOnLatest or False),
+            "transaction": payload.transaction,
+            "action": payload.action,
+            "comment": payload.comment,
+            "transactionType": payload.transactionType or "",
+            "performOnLatest": bool(payload.performOnLatest or False),
         }
+        _log().debug("firco_process_tool request", transaction=body["transaction"], action=body["action"])
 
-        headers: Dict[str, str] = {}
-
-        data, status, elapsed_ms = await request_json(
+        data, status, elapsed_us = await request_json(
             "POST",
             url,
             json_body=body,
-            headers=headers,
-            timeout_seconds=req.timeoutSeconds,
+            headers=_NO_HEADERS,
+            timeout_seconds=payload.timeoutSeconds,
         )
 
-        is_error = status >= 400 or (isinstance(data, dict) and data.get("success") is False) or (
-            isinstance(data, dict) and data.get("status") == "error"
-        )
-        meta = {"endpoint": "/api", "httpStatus": status, "elapsedMs": round(elapsed_ms, 2)}
-
-        if isinstance(data, dict):
-            data.setdefault("_clientMeta", meta)
-            data.setdefault("isError", is_error)
-            return data
-        else:  # pragma: no cover
-            return {
-                "status": "error" if is_error else "ok",
-                "message": "Unexpected non-dict response from Firco endpoint",
-                "raw": str(data)[:500],
-                "_clientMeta": meta,
-                "isError": True,
-            }
+        is_error = status >= 400 or data.get("success") is False or data.get("status") == "error"
+
+        # Skip building meta when the backend already returned one
+        if "_clientMeta" not in data:
+            data["_clientMeta"] = {"endpoint": _ENDPOINT, "httpStatus": status, "elapsedMs": round(elapsed_us / 1000, 2)}
+        if "isError" not in data:
+            data["isError"] = is_error
+        return data
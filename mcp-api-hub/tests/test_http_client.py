@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+
+from mcp_api_hub import http_client
+
+
+def test_shared_client_is_reused_until_closed():
+    client = http_client.get_shared_client()
+    assert http_client.get_shared_client() is client
+
+    asyncio.run(http_client.aclose_shared_client())
+    assert client.is_closed
+    assert http_client.get_shared_client() is not client
+    asyncio.run(http_client.aclose_shared_client())
+
+
+def test_shared_client_transport_uses_configured_pool(monkeypatch):
+    built = {}
+
+    def fake_transport(**kwargs):
+        built.update(kwargs)
+        return httpx.MockTransport(lambda request: httpx.Response(200))
+
+    monkeypatch.setattr(http_client.settings, "HTTP2", True)
+    monkeypatch.setattr(http_client.httpx, "AsyncHTTPTransport", fake_transport)
+    asyncio.run(http_client.aclose_shared_client())
+    http_client.get_shared_client()
+    assert built["http2"] is True
+    assert built["limits"] == httpx.Limits(max_connections=100, max_keepalive_connections=20)
+    asyncio.run(http_client.aclose_shared_client())
+
+
+def test_micro_batcher_coalesces_concurrent_calls(monkeypatch):
+    calls = []
+
+    async def fake_request_json(method, url, *, json_body=None, headers=None, timeout_seconds=None):
+        calls.append((url, json_body))
+        items = json_body["items"]
+        return {"results": [{"httpStatus": 200, "data": {"echo": i["id"]}} for i in items]}, 200, 1000
+
+    monkeypatch.setattr(http_client, "request_json", fake_request_json)
+    batcher = http_client.MicroBatcher("http://x/api/bpm", "http://x/api/bpm/batch", window_ms=1)
+
+    async def run():
+        return await asyncio.gather(*(batcher.submit({"id": n}) for n in range(3)))
+
+    results = asyncio.run(run())
+    assert [r[0]["echo"] for r in results] == [0, 1, 2]
+    assert len(calls) == 1 and calls[0][0].endswith("/batch")
+
+
+def test_micro_batcher_falls_back_when_batch_route_missing(monkeypatch):
+    urls = []
+
+    async def fake_request_json(method, url, *, json_body=None, headers=None, timeout_seconds=None):
+        urls.append(url)
+        if url.endswith("/batch"):
+            return {"status": "error"}, 404, 1000
+        return {"echo": json_body["id"]}, 200, 1000
+
+    monkeypatch.setattr(http_client, "request_json", fake_request_json)
+    batcher = http_client.MicroBatcher("http://x/api/bpm", "http://x/api/bpm/batch", window_ms=1)
+
+    async def run():
+        return await asyncio.gather(*(batcher.submit({"id": n}) for n in range(2)))
+
+    results = asyncio.run(run())
+    assert [r[0]["echo"] for r in results] == [0, 1]
+    assert urls.count("http://x/api/bpm/batch") == 1
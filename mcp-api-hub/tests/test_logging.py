@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import io
+import sys
+import time
+
+from mcp_api_hub.log_utils import get_logger, setup_logging
+
+
+def test_get_logger_caches_until_reconfigured():
+    setup_logging("INFO")
+    lg = get_logger("mcp_api_hub.tests")
+    assert get_logger("mcp_api_hub.tests") is lg
+    # Disabled levels are plain no-ops on the filtering bound logger
+    lg.debug("not emitted", payload={"a": 1})
+
+    setup_logging("DEBUG")
+    assert get_logger("mcp_api_hub.tests") is not lg
+
+
+def test_logger_from_before_reconfigure_still_emits(monkeypatch):
+    setup_logging("INFO")
+    lg = get_logger("mcp_api_hub.tests.stale")
+
+    out = io.StringIO()
+    monkeypatch.setattr(sys, "stderr", out)
+    setup_logging("INFO")
+    lg.info("after_reconfigure")
+
+    # Written by the listener thread
+    deadline = time.monotonic() + 2
+    while "after_reconfigure" not in out.getvalue() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert "after_reconfigure" in out.getvalue()
@@ -10,5 +10,16 @@ def test_autodiscover_and_register_no_crash():
     # Should import modules under mcp_api_hub.tools and call their register()
     autodiscover_and_register("mcp_api_hub.tools", mcp)
     # After registration, at least one tool should exist (bpm)
-    tools = [t.name for t in mcp._tools]  # type: ignore[attr-defined]
+    tools = [t.name for t in mcp._tool_manager.list_tools()]
     assert any("bpm" in name for name in tools)
+
+
+def test_autodiscover_skips_already_registered_modules():
+    mcp = FastMCP("test")
+    seen: set = set()
+    autodiscover_and_register("mcp_api_hub.tools", mcp, seen)
+    count = len(mcp._tool_manager.list_tools())
+    assert "mcp_api_hub.tools.bpm" in seen
+    # Second pass with the same `seen` set must not register tools again
+    autodiscover_and_register("mcp_api_hub.tools", mcp, seen)
+    assert len(mcp._tool_manager.list_tools()) == count
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from pydantic import ValidationError
+
+from mcp_api_hub.tools.bpm import BpmRequest
+from mcp_api_hub.tools.firco import FircoRequest
+
+
+def test_bpm_request_strips_before_length_check():
+    req = BpmRequest.model_validate({"transactionId": "  ABC123 ", "marketType": " MT103 "})
+    assert req.transactionId == "ABC123"
+    assert req.marketType == "MT103"
+
+    with pytest.raises(ValidationError):
+        BpmRequest.model_validate({"transactionId": "  ab  ", "marketType": "MT103"})
+
+
+def test_firco_request_strips_string_fields():
+    req = FircoRequest.model_validate({"transaction": " T1 ", "action": " STP-Release", "comment": " ok "})
+    assert (req.transaction, req.action, req.comment) == ("T1", "STP-Release", "ok")
+
+    with pytest.raises(ValidationError):
+        FircoRequest.model_validate({"transaction": "   ", "action": "x"})
+
+
+def test_bpm_tool_returns_payload_dict(monkeypatch):
+    from mcp.server.fastmcp import FastMCP
+
+    from mcp_api_hub.tools import bpm
+
+    async def fake_request_json(method, url, *, json_body=None, headers=None, timeout_seconds=None):
+        return {"status": "ok"}, 200, 12345
+
+    monkeypatch.setattr(bpm, "request_json", fake_request_json)
+    monkeypatch.setattr(bpm, "_bpm_batcher", lambda: None)
+    mcp = FastMCP("test")
+    bpm.register(mcp)
+    tool = mcp._tool_manager.get_tool("bpm_search_tool")
+
+    result = asyncio.run(tool.fn(BpmRequest(transactionId="ABC1", marketType="MT103")))
+    assert isinstance(result, dict)
+    assert result["status"] == "ok" and result["isError"] is False
+    assert result["_clientMeta"]["httpStatus"] == 200
+    assert result["_clientMeta"]["elapsedMs"] == 12.35
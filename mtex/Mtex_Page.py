@@ -1,7 +1,7 @@
 import logging
 from enum import Enum
-from typing import Union
-from playwright.sync_api import expect, Page
+from typing import Dict, Union
+from playwright.sync_api import expect, Locator, Page
 
 
 class BUWorkFlow(Enum):
@@ -42,28 +42,66 @@ class BUWorkFlow(Enum):
     ORI_TSF_BYPASS_UPDATE_DB = "ORI - TSF-BYPASS - update DB status"
 
 
+_WF_BY_VALUE = {w.value: w for w in BUWorkFlow}
+
+# Dropdown whose options are the BUWorkFlow values
+WORKFLOW_DROPDOWN_ID = "rc_select_1"
+
+# Shown once logged in (BU dropdown) / on the login form
+LANDING_SELECTOR = "input[id='rc_select_0']"
+LOGIN_FORM_SELECTOR = "input[name='PASSWORD']"
+
+
 class MtexPage:
     def __init__(self, page: Page):
         self.page = page
+        self._locator_cache: Dict[str, Locator] = {}
+
+    def _locator(self, selector: str) -> Locator:
+        """Return a cached locator so each selector string is only built once."""
+        loc = self._locator_cache.get(selector)
+        if loc is None:
+            loc = self._locator_cache[selector] = self.page.locator(selector)
+        return loc
+
+    def is_logged_in(self, timeout: int = 10000) -> bool:
+        """True if the MTex landing page (BU dropdown) is shown, i.e. the session is still valid.
+
+        Waits for the landing page or the login form, whichever renders first,
+        so a fresh or expired session is detected without a fixed delay.
+        """
+        try:
+            self._locator(f"{LANDING_SELECTOR}, {LOGIN_FORM_SELECTOR}").first.wait_for(
+                state="visible", timeout=timeout
+            )
+        except Exception:
+            return False
+        return self._locator(LANDING_SELECTOR).is_visible()
+
+    def login_form_shown(self) -> bool:
+        """True if the login form is on screen right now (no waiting)."""
+        return self._locator(LOGIN_FORM_SELECTOR).is_visible()
 
     def select_dropdown_option(
         self, dropdown_id: str, option_title: Union[str, BUWorkFlow]
     ) -> None:
         """Select an option from a dropdown with detailed error handling."""
         try:
-            title = (
-                option_title.value
-                if isinstance(option_title, BUWorkFlow)
-                else option_title
-            )
+            if isinstance(option_title, BUWorkFlow):
+                title = option_title.value
+            else:
+                title = option_title
+                # Reject unknown workflows before waiting on the browser
+                if dropdown_id == WORKFLOW_DROPDOWN_ID and title not in _WF_BY_VALUE:
+                    raise ValueError(f"Unknown workflow '{title}'")
             logging.debug("Selecting dropdown %s with title '%s'", dropdown_id, title)
 
             # Click to open dropdown
-            self.page.click(f"input[id='{dropdown_id}']", timeout=5000)
+            self._locator(f"input[id='{dropdown_id}']").click(timeout=5000)
             logging.debug("Dropdown opened for %s", dropdown_id)
 
             # Click the option
-            self.page.click(f"div[title='{title}']", timeout=5000)
+            self._locator(f"div[title='{title}']").click(timeout=5000)
             logging.info("Selected option '%s' from dropdown '%s'.", title, dropdown_id)
         except Exception as e:
             logging.error(
@@ -74,17 +112,26 @@ class MtexPage:
             )
             raise ValueError(f"Dropdown selection failed for {dropdown_id} -> {option_title}: {e}") from e
 
+    def wait_ready_for_upload(
+        self, file_input_selector: str = 'input[name="file"]', timeout: int = 3000
+    ) -> None:
+        """Wait for the upload input to be enabled after the workflow selection."""
+        self.page.wait_for_selector(
+            f"{file_input_selector}:not([disabled])", state="attached", timeout=timeout
+        )
+        logging.debug("Upload input '%s' is ready", file_input_selector)
+
     def upload_files_and_click_button(
         self, file_input_selector: str, file_paths: list, button_selector: str
     ) -> None:
         """Upload files and click the button with detailed error handling."""
         try:
             logging.debug("Uploading files to selector '%s': %s", file_input_selector, file_paths)
-            self.page.set_input_files(file_input_selector, file_paths, timeout=10000)
+            self._locator(file_input_selector).set_input_files(file_paths, timeout=10000)
             logging.info("Files uploaded successfully: %s", file_paths)
 
             logging.debug("Clicking button with selector '%s'", button_selector)
-            self.page.click(button_selector, timeout=5000)
+            self._locator(button_selector).click(timeout=5000)
             logging.info("Clicked the upload button successfully.")
         except Exception as e:
             logging.error("Failed to upload files and click button: %s", e)
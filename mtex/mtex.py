@@ -1,8 +1,10 @@
-import os, argparse, logging, sys, time, json
+import os, argparse, logging, sys, time, json, re, hashlib, threading
 from pathlib import Path
 from contextlib import suppress
+from concurrent.futures import ThreadPoolExecutor
 from playwright.sync_api import sync_playwright
 from utils.utils import login_to
+from mtex.Mtex_Page import MtexPage
 
 # --- Config (with environment variable support) ---
 INCOMING_DIR = "input"
@@ -18,6 +20,51 @@ DROPDOWN_WORKFLOW = ("rc_select_1", "ORI - TSF DEH ISO")
 
 TRANSACTION_NOT_FOUND_STATUS = "transaction_not_found_in_any_tab"
 
+# Wait for the upload input after the workflow selection; navigation keeps Playwright's default
+DEFAULT_TIMEOUT_MS = int(os.getenv("MTEX_TIMEOUT_MS", "3000"))
+# Third-party requests that play no part in the upload flow
+BLOCKED_REQUESTS = re.compile(r"(analytics|fonts|doubleclick|gtm|tracking|hotjar)")
+# Images, blocked only until the files are uploaded (see _RELOAD_IMAGES_JS)
+PRE_UPLOAD_MEDIA = "**/*.{png,jpg,jpeg,gif}"
+# Re-requests every <img> once the block is lifted, since aborted loads are
+# never retried on their own; resolves when all settle or after 5 s
+_RELOAD_IMAGES_JS = """
+() => Promise.race([
+  Promise.all(Array.from(document.images, img => {
+    const src = img.currentSrc || img.src;
+    if (!src) return null;
+    return new Promise(resolve => {
+      img.addEventListener("load", resolve, {once: true});
+      img.addEventListener("error", resolve, {once: true});
+      img.removeAttribute("srcset");
+      img.src = "";
+      img.src = src;
+    });
+  })),
+  new Promise(resolve => setTimeout(resolve, 5000)),
+])
+"""
+# Root of the persistent Chrome profiles so the login session survives between runs
+PROFILE_ROOT = os.getenv("MTEX_PROFILE_DIR", os.path.expanduser("~/.mtex_pw_profile"))
+# Chrome locks a profile dir, so concurrent uploads on the same one must queue
+_PROFILE_LOCKS = {}
+_PROFILE_LOCKS_GUARD = threading.Lock()
+
+
+def _profile_dir(url: str, username: str) -> str:
+    """One profile per user and MTex URL, so a stored session is never reused for someone else."""
+    key = hashlib.sha1(f"{username}@{url}".encode("utf-8")).hexdigest()[:16]
+    return os.path.join(PROFILE_ROOT, key)
+
+
+def _profile_lock(profile_dir: str) -> threading.Lock:
+    """Return the lock serialising access to one profile dir."""
+    with _PROFILE_LOCKS_GUARD:
+        lock = _PROFILE_LOCKS.get(profile_dir)
+        if lock is None:
+            lock = _PROFILE_LOCKS[profile_dir] = threading.Lock()
+        return lock
+
 
 # --- Logging Setup ---
 def setup_logging(log_level: str = "INFO") -> None:
@@ -33,62 +80,107 @@ def setup_logging(log_level: str = "INFO") -> None:
     )
 
 
+# --- File discovery ---
+def _resolve_target_dir(test_data_dir: str = None) -> str:
+    """Return the explicit test data dir, or the latest subfolder of the default base dir."""
+    if test_data_dir:
+        return test_data_dir
+    PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+    env_dir = os.environ.get("TEST_DATA_DIR")
+    if env_dir and os.path.isdir(env_dir):
+        base_dir = env_dir
+    elif os.path.isdir("C:/test_data"):
+        base_dir = "C:/test_data"
+    else:
+        base_dir = os.path.join(PROJECT_ROOT, "test_data")
+    if not os.path.isdir(base_dir):
+        raise FileNotFoundError(f"Test data directory not found: {base_dir}")
+    # Timestamped folder names sort lexically, so the latest is simply the max
+    with os.scandir(base_dir) as it:
+        latest = max((e.name for e in it if e.is_dir(follow_symlinks=False)), default=None)
+    if latest is None:
+        raise FileNotFoundError(f"No subdirectories in test_data: {base_dir}")
+    return os.path.join(base_dir, latest)
+
+
+def _iter_files(root: str) -> list:
+    """List all files under root using os.scandir (no per-entry stat or path join)."""
+    stack = [root]
+    out = []
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    out.append(entry.path)
+    return out
+
+
+def _collect_files(test_data_dir: str = None) -> tuple:
+    """Resolve the upload directory and list every file under it."""
+    target_dir = _resolve_target_dir(test_data_dir)
+    return target_dir, _iter_files(target_dir)
+
+
 # --- Main Script ---
 def mtex_upload(url: str, username: str, password: str, bu: str, workflow: str, test_data_dir: str = None) -> dict:
     """Upload files to MTex and return status."""
-    with sync_playwright() as p:
-        browser = p.chromium.launch(channel="chrome", headless=True)
-        context = browser.new_context()
-        page = context.new_page()
+    profile_dir = _profile_dir(url, username)
+    with _profile_lock(profile_dir), sync_playwright() as p:
+        context = p.chromium.launch_persistent_context(
+            user_data_dir=profile_dir, channel="chrome", headless=True
+        )
+        context.route(BLOCKED_REQUESTS, lambda route: route.abort())
+        context.route(PRE_UPLOAD_MEDIA, lambda route: route.abort())
+        # A persistent context opens with a blank tab already
+        page = context.pages[0] if context.pages else context.new_page()
         mtex_page = MtexPage(page)
         result = {"success": False, "message": "", "files_uploaded": []}
+        writer = ThreadPoolExecutor(max_workers=1)
+        screenshot_write = None
 
         try:
-            # Login
-            success = login_to(page, url, username, password)
-            if not success:
+            # Login, unless the stored profile still holds a valid session
+            page.goto(url)
+            if mtex_page.is_logged_in():
+                logging.info("Reusing stored MTex session for %s", username)
+            # Already on the login form: log in there instead of navigating again
+            elif not login_to(
+                page, url, username, password, navigate=not mtex_page.login_form_shown()
+            ):
                 result["message"] = f"Login failed for {username} to {url}"
                 return result
             result["success"] = True
 
-            # Select dropdown options
-            logging.info("Selecting dropdowns...")
-            mtex_page.select_dropdown_option("rc_select_0", bu)
-            mtex_page.select_dropdown_option("rc_select_1", workflow)
-
-            # Wait
-            page.wait_for_timeout(500)
-
-            # Determine target directory
-            if test_data_dir:
-                target_dir = test_data_dir
-            else:
-                PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
-                env_dir = os.environ.get("TEST_DATA_DIR")
-                if env_dir and os.path.isdir(env_dir):
-                    base_dir = env_dir
-                elif os.path.isdir("C:/test_data"):
-                    base_dir = "C:/test_data"
-                else:
-                    base_dir = os.path.join(PROJECT_ROOT, "test_data")
-                if not os.path.isdir(base_dir):
-                    raise FileNotFoundError(f"Test data directory not found: {base_dir}")
-                subdirs = [d for d in os.listdir(base_dir) if os.path.isdir(os.path.join(base_dir, d))]
-                if not subdirs:
-                    raise FileNotFoundError(f"No subdirectories in test_data: {base_dir}")
-                latest = sorted(subdirs)[-1]
-                target_dir = os.path.join(base_dir, latest)
-
-            logging.info(f"Uploading files from: {target_dir}")
-            file_paths = [os.path.join(r, f) for r, _, files in os.walk(target_dir) for f in files]
-            logging.info(f"Files to upload to MTex: {file_paths}")
+            # The directory scan does not depend on the page, so run it
+            # while the dropdown selections round-trip to the browser
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                files_future = pool.submit(_collect_files, test_data_dir)
+
+                # Select dropdown options
+                logging.info("Selecting dropdowns...")
+                mtex_page.select_dropdown_option("rc_select_0", bu)
+                mtex_page.select_dropdown_option("rc_select_1", workflow)
+
+                # Wait until the workflow-dependent upload input is usable
+                mtex_page.wait_ready_for_upload(timeout=DEFAULT_TIMEOUT_MS)
+
+                target_dir, file_paths = files_future.result()
+
+            logging.info("Uploading files from: %s", target_dir)
+            logging.info("Files to upload to MTex: %s", file_paths)
             mtex_page.upload_files_and_click_button('input[name="file"]', file_paths, "button.ant-btn-primary")
             result["files_uploaded"] = file_paths
 
-            # Screenshot
+            # Screenshot, with the images that were blocked before the upload
+            context.unroute(PRE_UPLOAD_MEDIA)
+            page.evaluate(_RELOAD_IMAGES_JS)
             screenshot_path = os.path.join(target_dir, "mtexops.png")
-            page.screenshot(path=screenshot_path, full_page=True)
-            logging.info(f"MTEx screenshot saved to: {screenshot_path}")
+            # Capture to memory and write to disk while the context shuts down
+            screenshot_write = writer.submit(
+                Path(screenshot_path).write_bytes, page.screenshot(full_page=True)
+            )
             result["screenshot_path"] = screenshot_path
             result["message"] = "Upload successful"
 
@@ -98,8 +190,14 @@ def mtex_upload(url: str, username: str, password: str, bu: str, workflow: str,
         finally:
             with suppress(Exception):
                 context.close()
-            with suppress(Exception):
-                browser.close()
+            writer.shutdown(wait=True)
+        if screenshot_write is not None:
+            try:
+                screenshot_write.result()
+                logging.info("MTEx screenshot saved to: %s", screenshot_path)
+            except OSError as e:
+                logging.error("Failed to save MTEx screenshot: %s", e)
+                result.pop("screenshot_path", None)
         return result
 
 
@@ -129,7 +227,7 @@ def main() -> int:
     result = mtex_upload(args.url, args.username, args.password, args.bu, args.workflow, args.test_data_dir)
     t_end = time.perf_counter()
 
-    logging.info(f"Duration: {t_end - t_start:.3f}s")
+    logging.info("Duration: %.3fs", t_end - t_start)
     print(json.dumps(result))
     return 0 if result["success"] else 1
 
@@ -152,51 +250,20 @@ def main_old(test_data_dir_override=None):
             mtex_page.select_dropdown_option(*DROPDOWN_BU)
             mtex_page.select_dropdown_option(*DROPDOWN_WORKFLOW)
 
-            # Wait (if needed)
-            page.wait_for_timeout(500)
-
-            # Determine target directory for upload
-            if test_data_dir_override:
-                target_dir = test_data_dir_override
-            else:
-                # Base test data dir: env override, C:/test_data, or project/test_data
-                PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
-                env_dir = os.environ.get("TEST_DATA_DIR")
-                if env_dir and os.path.isdir(env_dir):
-                    base_dir = env_dir
-                elif os.path.isdir("C:/test_data"):
-                    base_dir = "C:/test_data"
-                else:
-                    base_dir = os.path.join(PROJECT_ROOT, "test_data")
-                if not os.path.isdir(base_dir):
-                    raise FileNotFoundError(
-                        f"Test data directory not found: {base_dir}"
-                    )
-                # Pick the latest timestamped subfolder
-                subdirs = [
-                    d
-                    for d in os.listdir(base_dir)
-                    if os.path.isdir(os.path.join(base_dir, d))
-                ]
-                if not subdirs:
-                    raise FileNotFoundError(
-                        f"No subdirectories in test_data: {base_dir}"
-                    )
-                latest = sorted(subdirs)[-1]
-                target_dir = os.path.join(base_dir, latest)
-            logging.info(f"Uploading files from: {target_dir}")
-            # Collect files in target directory
-            file_paths = [
-                os.path.join(r, f) for r, _, files in os.walk(target_dir) for f in files
-            ]
-            logging.info(f"Files to upload to MTex: {file_paths}")
+            # Wait until the workflow-dependent upload input is usable
+            mtex_page.wait_ready_for_upload()
+
+            # Determine target directory for upload and collect its files
+            target_dir, file_paths = _collect_files(test_data_dir_override)
+            logging.info("Uploading files from: %s", target_dir)
+            logging.info("Files to upload to MTex: %s", file_paths)
             mtex_page.upload_files_and_click_button(
                 'input[name="file"]', file_paths, "button.ant-btn-primary"
             )
             # Take a full-page screenshot after scrolling element into view, saving to target_dir
             screenshot_path = os.path.join(target_dir, "mtexops.png")
             page.screenshot(path=screenshot_path, full_page=True)
-            logging.info(f"MTEx screenshot saved to: {screenshot_path}")
+            logging.info("MTEx screenshot saved to: %s", screenshot_path)
 
         except Exception as e:
             logging.exception("Unhandled exception occurred")
@@ -25,6 +25,9 @@ document.addEventListener('DOMContentLoaded', function() {
     // API configuration
     const API_PORT = 8088;
     const API_BASE = `http://localhost:${API_PORT}`;
+    // /api/pdf-status polling: interval and overall limit
+    const PDF_POLL_MS = 500;
+    const PDF_MAX_WAIT_MS = 10 * 60 * 1000;
     
     // Event Listeners
     // helper to toggle test radio enabled state
@@ -367,8 +370,23 @@ document.addEventListener('DOMContentLoaded', function() {
                 headers: { 'Content-Type': 'application/json' },
                 body: JSON.stringify({ screenshotDirs: normalizedDirs })
             });
-            const result = await response.json();
-            if (!result.success) throw new Error(result.error);
+            const job = await response.json();
+            if (!job.success) throw new Error(job.error);
+            // PDFs are built in the background; poll until the job finishes
+            const deadline = Date.now() + PDF_MAX_WAIT_MS;
+            let result;
+            do {
+                if (Date.now() > deadline) {
+                    throw new Error('timed out waiting for the PDF job');
+                }
+                await new Promise(resolve => setTimeout(resolve, PDF_POLL_MS));
+                const status = await fetch(`${API_BASE}/api/pdf-status?jobId=${job.jobId}`);
+                if (status.status === 404) {
+                    throw new Error('PDF job not found (it may have expired)');
+                }
+                result = await status.json();
+                if (!result.success) throw new Error(result.error);
+            } while (!result.done);
             window.open(result.url, '_blank');
             showStatus('PDF generated successfully!', 'success');
         } catch (e) {
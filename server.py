@@ -1,27 +1,154 @@
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import atexit
 import json
 import os
 import signal
+import socket
 import sys
 import logging
-import tempfile
-from datetime import datetime
-from playwright.sync_api import sync_playwright
-from filelock import FileLock
+import queue
+import shutil
+import gzip
+import hashlib
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import suppress
+from itertools import islice
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict, NamedTuple
+
+try:
+    import orjson as _json  # optional: C parser/serializer, returns bytes
+except ImportError:  # pragma: no cover - stdlib fallback
+
+    class _json:
+        @staticmethod
+        def loads(data):
+            return json.loads(bytes(data) if isinstance(data, memoryview) else data)
+
+        @staticmethod
+        def dumps(obj):
+            return json.dumps(obj).encode("utf-8")
+
 
 # Add the parent directory to sys.path to allow importing from helpers
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from firco.firco_page import FircoPage
+from utils.browser_pool import run_in_browser, shutdown_browser_pool, start_browser_pool
+from utils.utils import ensure_dir, today_str
+
 # Directories (set from env or fall back to defaults) so helpers can be reused
 INCOMING_DIR = os.getenv("INCOMING_DIR", "input")
 OUTPUT_DIR = os.getenv("OUTPUT_DIR", "output")
+# Static assets root, resolved once at import
+PUBLIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "public")
+
+# Filename fragments identifying screenshots written by the Firco flow
+SCREENSHOT_KEYWORDS = ("screenshot", "hld", "release", "transaction")
+
+# Content types for static assets served from public/
+MIME_MAP = {
+    ".html": "text/html",
+    ".js": "application/javascript",
+    ".css": "text/css",
+}
+
+# Shared pool for blocking file work (screenshot moves)
+_IO_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="io")
+
+# Raw reply for connections refused because the request queue is full
+SERVICE_UNAVAILABLE = (
+    b"HTTP/1.1 503 Service Unavailable\r\n"
+    b"Content-Length: 0\r\nRetry-After: 1\r\nConnection: close\r\n\r\n"
+)
+
+# Fields every /api payload must carry
+REQUIRED_FIELDS = frozenset(("transaction", "action", "comment"))
+
+# Request bodies are read into a per-thread buffer of this size
+MAX_BODY_BYTES = 1 << 20
+_BODY_BUF = threading.local()
+
+# Buffer size for transaction file reads
+READ_BUFFER_SIZE = 1 << 17
+
+# Constant header lines, encoded once
+_JSON_HEADER = b"Content-type: application/json\r\n"
+_GZIP_HEADER = b"Content-Encoding: gzip\r\n"
+_TEXT_HEADER = b"Content-type: text/plain; charset=utf-8\r\n"
+
+CORS_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "GET, POST, OPTIONS",
+    "Access-Control-Allow-Headers": "Content-Type",
+}
+
+# Static files up to this size are kept in memory, keyed by request path
+STATIC_CACHE_MAX_BYTES = 1024 * 1024
+# Browser caching policy for static assets (default: one week)
+STATIC_CACHE_CONTROL = f"public, max-age={int(os.getenv('STATIC_MAX_AGE', '604800'))}"
+
+
+class _StaticEntry(NamedTuple):
+    mtime_ns: int
+    raw: bytes
+    gzipped: bytes
+    headers: dict  # Content-type, ETag, Cache-Control and Vary, computed once per file version
+    etag: str
+    header_blob: bytes  # ``headers`` pre-encoded as raw header lines
+
+
+# Keyed by resolved file path, so URL spellings of one file share an entry
+_STATIC_CACHE: Dict[str, _StaticEntry] = {}
+# At most this many files are held; the oldest entry is dropped first
+STATIC_CACHE_MAX_ENTRIES = 128
+_STATIC_CACHE_LOCK = threading.Lock()
+
+
+# One queue and listener for the life of the process (see setup_logging())
+_LOG_QUEUE = queue.SimpleQueue()
+_log_listener = None
+
+
+def setup_logging():
+    """Log to console and transactions.log from a background thread.
+
+    Request threads only enqueue records (QueueHandler); a QueueListener
+    thread does the formatting and the blocking console/file writes. Calling
+    it again re-attaches the queue to the root logger and keeps the running
+    listener, so nothing already queued is lost.
+    """
+    global _log_listener
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.DEBUG)
+    root_logger.handlers = [QueueHandler(_LOG_QUEUE)]
+    if _log_listener is not None:
+        return
+    log_formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(log_formatter)
+    # File handler with rotation (10 MB max size, keep 5 backup files)
+    file_handler = RotatingFileHandler(
+        "transactions.log", maxBytes=10 * 1024 * 1024, backupCount=5
+    )
+    file_handler.setFormatter(log_formatter)
+
+    _log_listener = QueueListener(_LOG_QUEUE, console_handler, file_handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
+    logging.info("Logging configured to console and transactions.log file")
 
 
 # Helper functions that are missing in main_logic.py
 def parse_txt_file(txt_path):
     """Parse transaction file to extract transaction, action, and user comment."""
-    with open(txt_path, "r") as f:
-        lines = f.readlines()
+    # Only the first three lines matter; don't read past them
+    with open(txt_path, "r", buffering=READ_BUFFER_SIZE) as f:
+        lines = list(islice(f, 3))
 
     transaction = lines[0].strip() if len(lines) > 0 else ""
     action = lines[1].strip() if len(lines) > 1 else "STP-Release"
@@ -30,17 +157,70 @@ def parse_txt_file(txt_path):
     return transaction, action, user_comment
 
 
+def process_transaction(txt_path, transaction_type="", perform_on_latest=False):
+    """Run the Firco flow for a transaction TXT file on a pooled browser."""
+    transaction, action, user_comment = parse_txt_file(txt_path)
+    return process_transaction_data(transaction, action, user_comment, transaction_type)
+
+
+def process_transaction_data(transaction, action, user_comment, transaction_type=""):
+    """Run the Firco flow for in-memory transaction fields on a pooled browser.
+
+    Each call gets its own browser context; the Chromium process itself is
+    reused across requests (see utils/browser_pool.py).
+    """
+    return run_in_browser(
+        lambda page: FircoPage(page).flow_start(
+            transaction, action, user_comment, transaction_type
+        )
+    )
+
+
+def resolve_static_path(url_path):
+    """Map a URL path onto a file under PUBLIC_DIR, or None if it escapes the root."""
+    file_path = os.path.normpath(os.path.join(PUBLIC_DIR, url_path.lstrip("/")))
+    if os.path.commonpath((PUBLIC_DIR, file_path)) != PUBLIC_DIR:
+        return None
+    return file_path
+
+
+def _encode_headers(headers):
+    """Encode a header dict as raw ``Name: value\\r\\n`` lines."""
+    return "".join(f"{k}: {v}\r\n" for k, v in headers.items()).encode("latin-1")
+
+
+def _get_cached(file_path, st):
+    """Return the cache entry for a static file, re-reading it only when its mtime changes."""
+    entry = _STATIC_CACHE.get(file_path)
+    if entry and entry.mtime_ns == st.st_mtime_ns:
+        return entry
+    with open(file_path, "rb") as f:
+        raw = f.read()
+    etag = '"' + hashlib.blake2b(raw, digest_size=16).hexdigest() + '"'
+    headers = {
+        "Content-type": MIME_MAP.get(os.path.splitext(file_path)[1], "application/octet-stream"),
+        "ETag": etag,
+        "Cache-Control": STATIC_CACHE_CONTROL,
+        "Vary": "Accept-Encoding",
+    }
+    entry = _StaticEntry(
+        st.st_mtime_ns, raw, gzip.compress(raw, 6), headers, etag, _encode_headers(headers)
+    )
+    with _STATIC_CACHE_LOCK:
+        _STATIC_CACHE.pop(file_path, None)
+        while len(_STATIC_CACHE) >= STATIC_CACHE_MAX_ENTRIES:
+            del _STATIC_CACHE[next(iter(_STATIC_CACHE))]
+        _STATIC_CACHE[file_path] = entry
+    return entry
+
+
 def create_output_structure(transaction):
     """Create output folder structure for transaction."""
-    today = datetime.now().strftime("%Y-%m-%d")
-    date_folder = os.path.join(OUTPUT_DIR, today)
+    date_folder = os.path.join(OUTPUT_DIR, today_str())
     transaction_folder = os.path.join(date_folder, transaction)
 
-    # Ensure directories are created atomically to avoid race conditions in multi-threaded mode
-    lock_path = os.path.join(OUTPUT_DIR, ".dir.lock")
-    with FileLock(lock_path):
-        os.makedirs(date_folder, exist_ok=True)
-        os.makedirs(transaction_folder, exist_ok=True)
+    # makedirs(exist_ok=True) is already safe against concurrent creation
+    ensure_dir(transaction_folder)
 
     return transaction_folder, date_folder
 
@@ -50,49 +230,158 @@ def move_screenshots_to_folder(target_folder):
     If destination file already exists, it will be overwritten.
     The original screenshots are removed from the main folder.
     """
-    import shutil
+    with os.scandir(".") as it:
+        candidates = [
+            entry
+            for entry in it
+            if entry.name.endswith(".png")
+            and any(key in entry.name for key in SCREENSHOT_KEYWORDS)
+            and entry.is_file()
+        ]
+
+    # Renames are independent, so run them side by side and wait for all
+    wait([_IO_POOL.submit(_move_screenshot, entry, target_folder) for entry in candidates])
+
+
+def _move_screenshot(entry, target_folder):
+    dest_path = os.path.join(target_folder, entry.name)
+    try:
+        # Same filesystem: atomic rename that also overwrites the destination
+        os.replace(entry.path, dest_path)
+        logging.info("Moved screenshot to: %s", dest_path)
+    except OSError:
+        # Cross-device move: fall back to copy + delete
+        try:
+            shutil.copy2(entry.path, dest_path)
+            os.remove(entry.path)
+            logging.info("Copied screenshot to: %s", dest_path)
+        except Exception as e:
+            logging.error("Failed to handle screenshot %s: %s", entry.name, e)
+            # Other screenshots are moved regardless
 
-    for file in os.listdir("."):
-        if file.endswith(".png") and (
-            "screenshot" in file
-            or "hld" in file
-            or "release" in file
-            or "transaction" in file
-        ):
-            src_path = os.path.join(".", file)
-            dest_path = os.path.join(target_folder, file)
 
-            try:
-                # If destination exists, remove it first to avoid errors
-                if os.path.exists(dest_path):
-                    os.remove(dest_path)
-                    logging.info(f"Removed existing file at destination: {dest_path}")
+def handle_api_request(data):
+    """Run one validated /api payload through the Firco flow and build the JSON reply.
 
-                # Copy the file to destination
-                shutil.copy2(src_path, dest_path)
-                logging.info(f"Copied screenshot to: {dest_path}")
+    Shared by the http.server handler below and the aiohttp app in aio_server.py.
+    """
+    transaction_type = data.get("transaction_type", "")
+    logging.info("Received transactionType: %s", transaction_type)
+    try:
+        response = process_transaction_data(
+            data["transaction"], data["action"], data["comment"], transaction_type
+        )
+        # Ensure response is a dict, not a JSON string
+        if isinstance(response, str):
+            response = _json.loads(response)
+
+        # Check if processing was successful
+        if response["success"]:
+            return {
+                "success": True,
+                "message": response["message"],
+                "status_detail": response.get(
+                    "status_detail", response.get("status")
+                ),  # Include status_detail for frontend
+                "transactionId": uuid.uuid4().hex,
+            }
+
+        # Include detailed error information
+        return {
+            "success": False,
+            "message": response["message"],
+            "errorCode": response["error_code"],
+            "screenshotPath": response["screenshot_path"],
+            "status_detail": response.get(
+                "status_detail", response.get("status")
+            ),  # Include status_detail for frontend
+        }
+
+    except Exception as e:
+        logging.error("Error processing transaction: %s", e)
+        return {"success": False, "message": str(e), "errorCode": 500}
+
+
+class PooledHTTPServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer that hands requests to a bounded, reused thread pool.
+
+    At most ``max_workers`` requests run at once and ``max_queued`` more may
+    wait; beyond that new connections get an immediate 503.
+    """
 
-                # Remove the original file
-                os.remove(src_path)
-                logging.info(f"Removed original screenshot: {src_path}")
+    max_workers = int(os.getenv("SERVER_WORKERS", "8"))
+    max_queued = int(os.getenv("SERVER_QUEUE", "32"))
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="http"
+        )
+        self._slots = threading.BoundedSemaphore(self.max_workers + self.max_queued)
+
+    def process_request(self, request, client_address):
+        if not self._slots.acquire(blocking=False):
+            logging.warning("Request queue full, rejecting %s", client_address)
+            with suppress(OSError):
+                request.sendall(SERVICE_UNAVAILABLE)
+            self.shutdown_request(request)
+            return
+        self._pool.submit(self._run_request, request, client_address)
+
+    def _run_request(self, request, client_address):
+        try:
+            self.process_request_thread(request, client_address)
+        finally:
+            self._slots.release()
 
-            except Exception as e:
-                logging.error(f"Failed to handle screenshot {file}: {e}")
-                # Continue with next file even if this one failed
+    def server_close(self):
+        super().server_close()
+        self._pool.shutdown(wait=True)
 
 
 class SimpleHTTPRequestHandler(BaseHTTPRequestHandler):
+    # Keep-alive: every response below carries Content-Length
+    protocol_version = "HTTP/1.1"
+    # Idle keep-alive connections hold a pool thread, so drop them quickly
+    timeout = int(os.getenv("KEEPALIVE_TIMEOUT", "5"))
+
+    def setup(self):
+        super().setup()
+        # Small JSON replies and 304s go out at once instead of waiting on Nagle
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    # CORS headers never change, so they are encoded once for every response
+    _CORS_BLOB = _encode_headers(CORS_HEADERS)
+
     def _set_cors_headers(self):
         """Set headers for CORS support"""
-        self.send_header("Access-Control-Allow-Origin", "*")
-        self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
-        self.send_header("Access-Control-Allow-Headers", "Content-Type")
+        # Goes straight into the buffer that send_header() fills
+        self._headers_buffer.append(self._CORS_BLOB)
+
+    def _send_full(self, status, header_blob, body):
+        """Send status line, headers (plus CORS) and body in a single socket write.
+
+        ``header_blob`` holds pre-encoded ``Name: value\\r\\n`` lines.
+        """
+        self.log_request(status)
+        self.wfile.write(
+            b"".join(
+                (
+                    f"{self.protocol_version} {status} {self.responses[status][0]}\r\n"
+                    f"Server: {self.version_string()}\r\n"
+                    f"Date: {self.date_time_string()}\r\n".encode("latin-1"),
+                    b"Content-Length: %d\r\n" % len(body),
+                    header_blob,
+                    self._CORS_BLOB,
+                    b"\r\n",
+                    body,
+                )
+            )
+        )
 
     def do_OPTIONS(self):
         """Handle preflight CORS requests"""
-        self.send_response(200)
-        self._set_cors_headers()
-        self.end_headers()
+        self._send_full(200, b"", b"")
 
     def do_GET(self):
         # Serve index.html for the root endpoint
@@ -100,142 +389,113 @@ class SimpleHTTPRequestHandler(BaseHTTPRequestHandler):
             self.path = "/index.html"
 
         # Build the file path relative to the 'public' folder
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        file_path = os.path.join(base_dir, "public", self.path.lstrip("/"))
+        file_path = resolve_static_path(self.path)
+        entry = file = None
         try:
-            with open(file_path, "rb") as file:
-                self.send_response(200)
-                if self.path.endswith(".html"):
-                    self.send_header("Content-type", "text/html")
-                elif self.path.endswith(".js"):
-                    self.send_header("Content-type", "application/javascript")
-                elif self.path.endswith(".css"):
-                    self.send_header("Content-type", "text/css")
-                else:
-                    self.send_header("Content-type", "application/octet-stream")
-                self._set_cors_headers()
-                self.end_headers()
-                self.wfile.write(file.read())
-        except Exception as e:
-            self.send_error(404, "File not found: " + self.path)
-
-    def do_POST(self):
-        # Define a simple API endpoint at /api
-        if self.path == "/api":
-            content_length = int(self.headers.get("Content-Length", 0))
-            post_data = self.rfile.read(content_length)
-            try:
-                data = json.loads(post_data)
-            except json.JSONDecodeError:
-                self.send_response(400)
-                self._set_cors_headers()
-                self.end_headers()
-                self.wfile.write(b"Invalid JSON")
-                return
-
-            # Accept transactionType if present
-            required_fields = ["transaction", "action", "comment"]
-            transaction_type = data.get("transaction_type", "")
-            if not all(key in data for key in required_fields):
-                self.send_response(400)
-                self._set_cors_headers()
-                self.end_headers()
-                self.wfile.write(
-                    f'Missing required fields: {", ".join(required_fields)}'.encode(
-                        "utf-8"
-                    )
-                )
-                return
-
-            logging.info(f"Received transactionType: {transaction_type}")
-            # Create a temporary file with the transaction data
-            try:
-                # Create a temporary file
-                with tempfile.NamedTemporaryFile(
-                    mode="w", delete=False, dir=INCOMING_DIR, suffix=".txt"
-                ) as temp_file:
-                    temp_file_path = temp_file.name
-                    # Format the data as expected by parse_txt_file
-                    temp_file.write(
-                        f"{data['transaction']}\n{data['action']}\n{data['comment']}\n{transaction_type}"
-                    )
-
-                logging.info(f"Created temporary file: {temp_file_path}")
-
-                perform_on_latest = bool(data.get("performOnLatest", False))
-
-                with sync_playwright() as playwright:
-                    response = process_transaction(
-                        playwright,
-                        temp_file_path,
-                        transaction_type=transaction_type,
-                        perform_on_latest=perform_on_latest,
-                    )
-                    # Ensure response is a dict, not a JSON string
-                    if isinstance(response, str):
-                        response = json.loads(response)
-
-                # Check if processing was successful
-                if response["success"]:
-                    response = {
-                        "success": True,
-                        "message": response["message"],
-                        "status_detail": response.get(
-                            "status_detail", response.get("status")
-                        ),  # Include status_detail for frontend
-                        "transactionId": os.path.basename(temp_file_path).split(".")[0],
-                    }
-                else:
-                    # Include detailed error information
-                    response = {
-                        "success": False,
-                        "message": response["message"],
-                        "errorCode": response["error_code"],
-                        "screenshotPath": response["screenshot_path"],
-                        "status_detail": response.get(
-                            "status_detail", response.get("status")
-                        ),  # Include status_detail for frontend
-                    }
-
-                    # If temp file was created but processing failed, we should clean it up
-                    if os.path.exists(temp_file_path):
-                        try:
-                            os.remove(temp_file_path)
-                            logging.info(
-                                f"Cleaned up temporary file after error: {temp_file_path}"
-                            )
-                        except Exception as cleanup_error:
-                            logging.error(
-                                f"Failed to clean up temporary file: {cleanup_error}"
-                            )
-
-            except Exception as e:
-                logging.error(f"Error processing transaction: {str(e)}")
-                response = {"success": False, "message": str(e), "errorCode": 500}
-
-                # If temp file was created but processing failed, we should clean it up
-                if "temp_file_path" in locals() and os.path.exists(temp_file_path):
-                    try:
-                        os.remove(temp_file_path)
-                        logging.info(f"Cleaned up temporary file: {temp_file_path}")
-                    except Exception as cleanup_error:
-                        logging.error(
-                            f"Failed to clean up temporary file: {cleanup_error}"
-                        )
-
-            response_data = json.dumps(response).encode("utf-8")
+            if file_path is None:
+                raise FileNotFoundError(self.path)
+            st = os.stat(file_path)
+            if st.st_size <= STATIC_CACHE_MAX_BYTES:
+                entry = _get_cached(file_path, st)
+            else:
+                file = open(file_path, "rb")
+        except OSError:
+            self._send_full(404, b"", b"")  # bare 404, no HTML error page
+            return
+
+        if entry is not None:
+            if self.headers.get("If-None-Match") == entry.etag:
+                self._send_full(304, b"ETag: %s\r\n" % entry.etag.encode(), b"")
+            elif "gzip" in self.headers.get("Accept-Encoding", ""):
+                self._send_full(200, entry.header_blob + _GZIP_HEADER, entry.gzipped)
+            else:
+                self._send_full(200, entry.header_blob, entry.raw)
+            return
+
+        # Large files are not cached; stream them straight from disk
+        with file:
             self.send_response(200)
-            self.send_header("Content-type", "application/json")
-            self.send_header("Content-Length", len(response_data))
+            self.send_header(
+                "Content-type",
+                MIME_MAP.get(os.path.splitext(file_path)[1], "application/octet-stream"),
+            )
+            self._headers_buffer.append(b"Content-Length: %d\r\n" % st.st_size)
             self._set_cors_headers()
             self.end_headers()
-            self.wfile.write(response_data)
-        else:
-            self.send_error(404, "Endpoint not found")
+            self._send_file(file, st.st_size)
+
+    def _send_file(self, file, size):
+        """Stream ``file`` to the client, zero-copy via sendfile where available.
+
+        socket.sendfile loops over partial sends itself and falls back to
+        plain send() on platforms without os.sendfile.
+        """
+        self.connection.sendfile(file, 0, size)
+
+    def _read_body(self, length):
+        """Read up to ``length`` body bytes into this thread's reusable buffer.
+
+        Returns a memoryview over the buffer; it is only valid until the
+        thread reads its next request, so parse it straight away.
+        """
+        buf = getattr(_BODY_BUF, "buf", None)
+        if buf is None:
+            buf = _BODY_BUF.buf = bytearray(MAX_BODY_BYTES)
+        if length > len(buf):
+            # The rest of the body stays unread, so the connection can't be reused
+            self.close_connection = True
+            length = len(buf)
+        view = memoryview(buf)[:length]
+        off = 0
+        while off < length:
+            n = self.rfile.readinto(view[off:])
+            if not n:
+                break
+            off += n
+        return view[:off]
+
+    def do_POST(self):
+        handler = self._POST_ROUTES.get(self.path)
+        if handler is None:
+            # The body is never read, so it would be parsed as the next request
+            self.close_connection = True
+            self._send_full(404, b"Connection: close\r\n", b"")
+            return
+        handler(self)
+
+    def _handle_api(self):
+        """POST /api: run a transaction through the Firco flow."""
+        content_length = int(self.headers.get("Content-Length", 0))
+        if content_length > MAX_BODY_BYTES:
+            # Refuse before reading anything; the unread body rules out keep-alive
+            self.close_connection = True
+            self._send_full(413, b"Connection: close\r\n", b"")
+            return
+        post_data = self._read_body(content_length)
+        try:
+            data = _json.loads(post_data)
+        except json.JSONDecodeError:
+            self._send_full(400, _TEXT_HEADER, b"Invalid JSON")
+            return
+
+        missing = REQUIRED_FIELDS.difference(data) if isinstance(data, dict) else REQUIRED_FIELDS
+        if missing:
+            self._send_full(
+                400,
+                _TEXT_HEADER,
+                f'Missing required fields: {", ".join(sorted(missing))}'.encode("utf-8"),
+            )
+            return
+
+        response = handle_api_request(data)
+        response_data = _json.dumps(response)
+        self._send_full(200, _JSON_HEADER, response_data)
+
+    _POST_ROUTES = {"/api": _handle_api}
 
 
 def run(
-    server_class=ThreadingHTTPServer,
+    server_class=PooledHTTPServer,
     handler_class=SimpleHTTPRequestHandler,
     host: str = "0.0.0.0",
     port: int = 8088,
@@ -248,6 +508,9 @@ def run(
     os.makedirs(INCOMING_DIR, exist_ok=True)
     os.makedirs(OUTPUT_DIR, exist_ok=True)
 
+    # Launch the pooled browsers while the socket is being set up
+    start_browser_pool()
+
     server_address = (host, port)
     httpd = server_class(server_address, handler_class)
 
@@ -255,6 +518,7 @@ def run(
     def signal_handler(sig, frame):
         logging.info("Shutting down the server gracefully...")
         httpd.server_close()
+        shutdown_browser_pool()
         logging.info("Server has been shut down")
         sys.exit(0)
 
@@ -268,6 +532,7 @@ def run(
         pass
     finally:
         httpd.server_close()
+        shutdown_browser_pool()
         logging.info("Server has been shut down")
 
 
@@ -1,9 +1,24 @@
 import os
 import json
 import re
-from datetime import datetime
-from playwright.sync_api import sync_playwright
-from main_logic import process_transaction, OUTPUT_DIR
+import string
+from pathlib import Path
+from server import process_transaction, OUTPUT_DIR
+from utils.utils import ensure_dir, today_str
+
+# Delete-tables matching re's [^\w] / [^\w\-] on ASCII input
+_UPI_KEEP = frozenset(string.ascii_letters + string.digits + "_")
+_UPI_DEL = str.maketrans("", "", "".join(chr(c) for c in range(128) if chr(c) not in _UPI_KEEP))
+_ACTION_DEL = str.maketrans(
+    "", "", "".join(chr(c) for c in range(128) if chr(c) not in _UPI_KEEP | {"-"})
+)
+
+
+def _sanitize(value: str, table: dict, pattern: str) -> str:
+    """Remove the characters ``pattern`` matches; translate() for ASCII, regex otherwise."""
+    if value.isascii():
+        return value.translate(table)
+    return re.sub(pattern, "", value)
 
 
 def run_disposition(output_dir_name: str, action: str, upi: str) -> dict:
@@ -20,10 +35,10 @@ def run_disposition(output_dir_name: str, action: str, upi: str) -> dict:
     """
     # Build paths
     txt_folder = os.path.join(OUTPUT_DIR, output_dir_name)
-    os.makedirs(txt_folder, exist_ok=True)
+    ensure_dir(txt_folder)
     # Sanitize UPI and action to safe filename components
-    safe_upi = re.sub(r"[^\w]", "", upi)
-    safe_action = re.sub(r"[^\w\-]", "", action)
+    safe_upi = _sanitize(upi, _UPI_DEL, r"[^\w]")
+    safe_action = _sanitize(action, _ACTION_DEL, r"[^\w\-]")
     txt_name = f"{safe_upi}-{safe_action}.txt"
     txt_path = os.path.join(txt_folder, txt_name)
 
@@ -40,12 +55,10 @@ def run_disposition(output_dir_name: str, action: str, upi: str) -> dict:
         raise ValueError(f"Unknown action '{action}'")
     # Write transaction instruction lines: transaction, action, and comment
     transaction = upi
-    with open(txt_path, 'w', encoding='utf-8') as f:
-        f.write(f"{transaction}\n{norm_action}\nBEYOND")
+    Path(txt_path).write_bytes(f"{transaction}\n{norm_action}\nBEYOND".encode("utf-8"))
 
-    # Run Playwright processor
-    with sync_playwright() as p:
-        result_str = process_transaction(p, txt_path)
+    # Run the Firco flow on the shared browser pool
+    result_str = process_transaction(txt_path)
 
     try:
         result = json.loads(result_str)
@@ -53,7 +66,6 @@ def run_disposition(output_dir_name: str, action: str, upi: str) -> dict:
         # Fallback if already a dict
         result = result_str
     # Attach screenshot path for PDF generation
-    date_folder = datetime.now().strftime("%Y-%m-%d")
-    screenshot_folder = os.path.join(OUTPUT_DIR, date_folder, upi)
+    screenshot_folder = os.path.join(OUTPUT_DIR, today_str(), upi)
     result["screenshot_path"] = screenshot_folder
     return result
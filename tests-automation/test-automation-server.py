@@ -1,31 +1,250 @@
 import os
+import stat
+import uuid
 import sys
 import json
 import http.server
-import socketserver
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from playwright.sync_api import sync_playwright
-from bpm import (
-    perform_login_and_setup,
-    select_options_and_submit,
-    handle_dropdown_and_search,
-)
-from Bpm_Page import BPMPage, Options
+from urllib.parse import parse_qs, urlsplit
 from xml_processor import XMLTemplateProcessor
-from mtex import main as mtex_main
-from disposition_service import run_disposition
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import A4, landscape
+
+# Playwright (via bpm/mtex/disposition_service/browser_pool) and reportlab are
+# imported inside the handlers that need them, so the server starts and serves
+# static files and /api/test-types without loading them.
+
+try:
+    import orjson
+
+    _loads = orjson.loads  # accepts bytes directly, no decode step
+    _dumps = orjson.dumps  # returns bytes, no encode step
+except ImportError:  # stdlib fallback
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj).encode()
 
 # Get the absolute path to the project root
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 SERVER_DIR = os.path.dirname(os.path.abspath(__file__))
 
 PORT = 8090
+# Verbose per-request diagnostics (template lookup, directory listings)
+DEBUG = os.environ.get("TEST_SERVER_DEBUG") == "1"
 TEMPLATES_DIR = os.path.join(SERVER_DIR, "templates")
 OUTPUT_DIR = os.path.join(PROJECT_ROOT, "output")  # Changed to use 'output' folder
 PUBLIC_DIR = os.path.join(PROJECT_ROOT, "public")
 
+# Background work inside a request (BPM checks, PDF builds)
+_POOL = ThreadPoolExecutor(max_workers=4)
+
+# MTex uploads, dispositions and PDF builds share the CWD screenshots
+# (bpm_<tag>.jpg, Firco captures) and the dated output folders, so only one
+# of them runs at a time; static files and /api/test-types are not held up
+_AUTOMATION_LOCK = threading.Lock()
+
+SERVICE_UNAVAILABLE = (
+    b"HTTP/1.1 503 Service Unavailable\r\n"
+    b"Content-Length: 0\r\nRetry-After: 1\r\nConnection: close\r\n\r\n"
+)
+
+# /api/generate-pdf jobs: job id -> (Future of the generated PDF paths,
+# monotonic finish time or None). Entries are dropped once /api/pdf-status
+# has reported them finished, or PDF_JOB_TTL seconds after finishing if
+# nobody polls them.
+_PDF_POOL = ThreadPoolExecutor(max_workers=2)
+PDF_JOB_TTL = 600
+_JOBS = {}
+_JOBS_LOCK = threading.Lock()
+
+
+def _add_job(future):
+    """Register a PDF build, return its job id and expire stale finished jobs."""
+    job_id = uuid.uuid4().hex
+    cutoff = time.monotonic() - PDF_JOB_TTL
+    with _JOBS_LOCK:
+        for stale in [j for j, (_, done_at) in _JOBS.items() if done_at is not None and done_at < cutoff]:
+            del _JOBS[stale]
+        _JOBS[job_id] = (future, None)
+    future.add_done_callback(lambda f: _mark_job_done(job_id))
+    return job_id
+
+
+def _mark_job_done(job_id):
+    with _JOBS_LOCK:
+        entry = _JOBS.get(job_id)
+        if entry is not None:
+            _JOBS[job_id] = (entry[0], time.monotonic())
+
+
+MIME_TYPES = {
+    ".html": "text/html",
+    ".js": "application/javascript",
+    ".css": "text/css",
+    ".png": "image/png",
+    ".svg": "image/svg+xml",
+}
+
+# Screenshot formats picked up for the PDFs
+SCREENSHOT_EXTENSIONS = (".png", ".jpg", ".jpeg")
+
+# Either slash style in client-supplied directories -> os.sep
+_SEP_TABLE = str.maketrans({"\\": os.sep, "/": os.sep})
+
+# Headers sent with every response besides Content-type
+_COMMON_HEADERS = (
+    ("Access-Control-Allow-Origin", "*"),
+    ("Access-Control-Allow-Methods", "GET, POST, OPTIONS"),
+    ("Access-Control-Allow-Headers", "Content-Type, Authorization"),
+    ("Access-Control-Allow-Credentials", "true"),
+    ("Cache-Control", "no-store, no-cache, must-revalidate"),
+    ("Pragma", "no-cache"),
+    ("Expires", "0"),
+)
+
+
+def _encode_common_headers(content_type):
+    headers = (("Content-type", content_type),) + _COMMON_HEADERS
+    return "".join(f"{k}: {v}\r\n" for k, v in headers).encode("latin-1")
+
+
+# content type -> encoded header block, built once per type
+_HEADER_BLOBS = {
+    ct: _encode_common_headers(ct) for ct in ("application/json", *MIME_TYPES.values())
+}
+
+# Constant GET /api/* bodies, serialized once
+_TEST_TYPES_BODY = _dumps({"testTypes": ["Screening response", "Cuban Filter"]})
+_API_NOT_FOUND_BODY = _dumps({"success": False, "error": "API endpoint not found"})
+
+# template path -> (mtime_ns, contents); re-read only when the file changes
+_TEMPLATE_CACHE = {}
+
+
+def _ts_compact():
+    """Current local time as YYYYMMDD_HHMMSS (output folder names)."""
+    n = datetime.now()
+    return f"{n.year:04d}{n.month:02d}{n.day:02d}_{n.hour:02d}{n.minute:02d}{n.second:02d}"
+
+
+def _load_template(template_path):
+    """Return the template's bytes, served from memory unless its mtime changed.
+
+    Raises FileNotFoundError if the template does not exist.
+    """
+    st = os.stat(template_path)
+    cached = _TEMPLATE_CACHE.get(template_path)
+    if cached and cached[0] == st.st_mtime_ns:
+        return cached[1]
+    with open(template_path, "rb") as f:
+        contents = f.read()
+    _TEMPLATE_CACHE[template_path] = (st.st_mtime_ns, contents)
+    return contents
+
+
+def _bpm_snapshot(upi, tag):
+    """Look up ``upi`` in BPM and screenshot the result as bpm_<tag>.jpg.
+
+    Runs on the shared browser pool (utils/browser_pool.py), so only a fresh
+    context is created per call instead of a whole Chromium launch.
+    """
+    from bpm import (
+        perform_login_and_setup,
+        select_options_and_submit,
+        handle_dropdown_and_search,
+    )
+    from Bpm_Page import BPMPage, Options
+    from utils.browser_pool import run_in_browser
+
+    def flow(page):
+        bpm_page = BPMPage(page)
+        perform_login_and_setup(bpm_page)
+        select_options_and_submit(bpm_page, page, [Options.ENTERPRISE_ISO])
+        value, _ = handle_dropdown_and_search(bpm_page, page, upi)
+        # Viewport-only JPEG: far less to paint and encode than a full-page PNG
+        page.screenshot(path=f"bpm_{tag}.jpg", type="jpeg", quality=80)
+        return value
+
+    return run_in_browser(flow)
+
+
+def _sorted_screenshots(folder):
+    """Paths of the screenshots in ``folder``, oldest first by creation time."""
+    with os.scandir(folder) as it:
+        entries = [e for e in it if e.name.lower().endswith(SCREENSHOT_EXTENSIONS)]
+    entries.sort(key=lambda e: e.stat().st_ctime)
+    return [e.path for e in entries]
+
+
+def _build_pdf(folder, image_paths):
+    """Write folder/screenshots.pdf with one landscape A4 page per image; return its path.
+
+    Uses img2pdf when installed, which embeds the PNG/JPEG streams as-is instead
+    of decoding and re-compressing every image; reportlab otherwise.
+    """
+    pdf_path = os.path.join(folder, "screenshots.pdf")
+    try:
+        import img2pdf
+    except ImportError:
+        _draw_pdf(pdf_path, image_paths)
+        return pdf_path
+
+    layout = img2pdf.get_layout_fun((img2pdf.mm_to_pt(297), img2pdf.mm_to_pt(210)))
+    try:
+        pdf_bytes = img2pdf.convert(image_paths, layout_fun=layout)
+    except img2pdf.AlphaChannelError:
+        # img2pdf will not embed transparent PNGs without re-encoding them
+        _draw_pdf(pdf_path, image_paths)
+    else:
+        with open(pdf_path, "wb") as f:
+            f.write(pdf_bytes)
+    return pdf_path
+
+
+def _draw_pdf(pdf_path, image_paths):
+    """reportlab fallback for _build_pdf: one drawImage + showPage per image."""
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.pagesizes import A4, landscape
+    from reportlab.lib.utils import ImageReader
+
+    c = canvas.Canvas(pdf_path, pagesize=landscape(A4))
+    w, h = landscape(A4)
+    for path in image_paths:
+        c.drawImage(ImageReader(path), 0, 0, width=w, height=h)
+        c.showPage()
+    c.save()
+
+
+def _pdf_for_dir(d):
+    """Build the screenshots PDF for one requested directory; None if missing or empty."""
+    # Locate folder
+    full_d = os.path.join(PROJECT_ROOT, d)
+    if not os.path.isdir(full_d):
+        full_d = os.path.join(os.getcwd(), d)
+    if not os.path.isdir(full_d):
+        return None
+    # Gather screenshots, sorted by creation time
+    image_paths = _sorted_screenshots(full_d)
+    if not image_paths:
+        return None
+    # Create PDF in same folder
+    pdf_path = _build_pdf(full_d, image_paths)
+    # Log PDF creation path
+    print(f"Generated PDF (generate_pdf): {pdf_path}")
+    return pdf_path
+
+
+def _build_all_pdfs(dirs):
+    """Build one PDF per directory, in parallel; return the paths written."""
+    with _AUTOMATION_LOCK:
+        pdf_paths = [p for p in _POOL.map(_pdf_for_dir, dirs) if p]
+    if not pdf_paths:
+        raise FileNotFoundError("No PDFs generated, directories empty or not found")
+    return pdf_paths
+
 
 class SimpleHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
     def __init__(self, *args, **kwargs):
@@ -33,19 +252,32 @@ class SimpleHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
         self.directory = "public"
         super().__init__(*args, directory=self.directory, **kwargs)
 
-    def _set_headers(self, status_code=200, content_type="application/json"):
+    def _set_headers(self, status_code=200, content_type="application/json", content_length=None):
         """Set common headers including CORS"""
         self.send_response(status_code)
-        self.send_header("Content-type", content_type)
-        self.send_header("Access-Control-Allow-Origin", "*")
-        self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
-        self.send_header("Access-Control-Allow-Headers", "Content-Type, Authorization")
-        self.send_header("Access-Control-Allow-Credentials", "true")
-        self.send_header("Cache-Control", "no-store, no-cache, must-revalidate")
-        self.send_header("Pragma", "no-cache")
-        self.send_header("Expires", "0")
+        blob = _HEADER_BLOBS.get(content_type)
+        if blob is None:
+            blob = _HEADER_BLOBS[content_type] = _encode_common_headers(content_type)
+        self._headers_buffer.append(blob)
+        if content_length is not None:
+            self._headers_buffer.append(b"Content-Length: %d\r\n" % content_length)
         self.end_headers()
 
+    def _read_body(self, length, chunk=65536):
+        """Read the request body in ``chunk``-sized pieces into one preallocated bytearray."""
+        buf = bytearray(length)
+        mv = memoryview(buf)
+        off = 0
+        while off < length:
+            n = self.rfile.readinto(mv[off : off + chunk])
+            if not n:
+                break
+            off += n
+        mv.release()
+        if off < length:
+            del buf[off:]  # client sent less than it announced
+        return buf
+
     def do_OPTIONS(self):
         """Handle OPTIONS method for CORS preflight"""
         self._set_headers(200)
@@ -58,70 +290,70 @@ class SimpleHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
 
         # Serve static files
         try:
-            # Default to index.html if path is root
-            if self.path == "/":
-                self.path = "/tests-automation.html"
-
-            # Check if file exists
-            file_path = os.path.join(PUBLIC_DIR, self.path.lstrip("/"))
-            if not os.path.exists(file_path):
+            # Default to the app page if path is root
+            rel = self.path[1:] or "tests-automation.html"
+
+            # Check if file exists (one stat also gives the size)
+            file_path = os.path.join(PUBLIC_DIR, rel)
+            try:
+                st = None if ".." in rel else os.stat(file_path)
+            except OSError:
+                st = None
+            if st is None or not stat.S_ISREG(st.st_mode):
                 print(f"File not found: {file_path}")
                 self.send_error(404, "File not found")
                 return
 
             # Set content type based on file extension
-            if file_path.endswith(".html"):
-                mimetype = "text/html"
-            elif file_path.endswith(".js"):
-                mimetype = "application/javascript"
-            elif file_path.endswith(".css"):
-                mimetype = "text/css"
-            else:
-                mimetype = "application/octet-stream"
+            mimetype = MIME_TYPES.get(
+                os.path.splitext(rel)[1].lower(), "application/octet-stream"
+            )
 
-            self._set_headers(200, mimetype)
             with open(file_path, "rb") as f:
-                self.wfile.write(f.read())
+                self._set_headers(200, mimetype, st.st_size)
+                # Zero-copy where the OS supports it; socket.sendfile falls back to send()
+                self.connection.sendfile(f, 0, st.st_size)
 
         except Exception as e:
             self.send_error(500, str(e))
 
     def do_POST(self):
         try:
-            if self.path == "/api/generate-test-files":
+            path = urlsplit(self.path).path
+            if path == "/api/generate-test-files":
                 return self.handle_generate_test_files()
-            elif self.path == "/api/upload-to-mtex":
+            elif path == "/api/upload-to-mtex":
                 return self.handle_upload_to_mtex()
-            elif self.path == "/api/disposition-transactions":
+            elif path == "/api/disposition-transactions":
                 return self.handle_disposition_transactions()
-            elif self.path == "/api/generate-pdf":
+            elif path == "/api/generate-pdf":
                 return self.handle_generate_pdf()
             self.send_error(404, "Not Found")
         except Exception as e:
             print(f"Error in POST handler: {str(e)}")
             self._set_headers(500)
             self.wfile.write(
-                json.dumps(
+                _dumps(
                     {"success": False, "error": f"Internal server error: {str(e)}"}
-                ).encode()
+                )
             )
 
     def handle_api_request(self):
         if self.path == "/api/test-types":
-            self.send_response(200)
-            self.send_header("Content-type", "application/json")
-            self.end_headers()
-            response = {"testTypes": ["Screening response", "Cuban Filter"]}
-            self.wfile.write(json.dumps(response).encode())
+            self._set_headers(200, content_length=len(_TEST_TYPES_BODY))
+            self.wfile.write(_TEST_TYPES_BODY)
+        elif self.path.startswith("/api/pdf-status"):
+            self.handle_pdf_status()
         else:
-            self.send_error(404, "API endpoint not found")
+            self._set_headers(404, content_length=len(_API_NOT_FOUND_BODY))
+            self.wfile.write(_API_NOT_FOUND_BODY)
 
     def handle_generate_test_files(self):
         try:
             content_length = int(self.headers.get("Content-Length", 0))
             if content_length > 0:
-                post_data = self.rfile.read(content_length)
-                data = json.loads(post_data.decode())
+                post_data = self._read_body(content_length)
+                data = _loads(post_data)
             else:
                 data = {}
 
@@ -131,9 +363,9 @@ class SimpleHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
             if not test_name:
                 self._set_headers(400)
                 self.wfile.write(
-                    json.dumps(
+                    _dumps(
                         {"success": False, "error": "Test name is required"}
-                    ).encode()
+                    )
                 )
                 return
 
@@ -147,34 +379,37 @@ class SimpleHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
                 template_filename = f"{test_name_lower}_template.xml"
 
             template_path = os.path.join(TEMPLATES_DIR, template_filename)
-            print(f"[DEBUG] Looking for template: {template_filename}")
-
-            print(f"\n[DEBUG] Looking for template at: {template_path}")
-            print(f"[DEBUG] Current working directory: {os.getcwd()}")
-            print(f"[DEBUG] Templates directory: {TEMPLATES_DIR}")
-            print(
-                f"[DEBUG] Files in templates dir: {os.listdir(TEMPLATES_DIR) if os.path.exists(TEMPLATES_DIR) else 'Directory not found'}"
-            )
+            if DEBUG:
+                print(f"[DEBUG] Looking for template: {template_filename}")
+                print(f"\n[DEBUG] Looking for template at: {template_path}")
+                print(f"[DEBUG] Current working directory: {os.getcwd()}")
+                print(f"[DEBUG] Templates directory: {TEMPLATES_DIR}")
+                print(
+                    f"[DEBUG] Files in templates dir: {os.listdir(TEMPLATES_DIR) if os.path.exists(TEMPLATES_DIR) else 'Directory not found'}"
+                )
 
-            if not os.path.exists(template_path):
+            try:
+                template_bytes = _load_template(template_path)
+            except FileNotFoundError:
                 error_msg = f"Template not found: {template_path} (cwd: {os.getcwd()})"
                 print(f"[ERROR] {error_msg}")
                 self._set_headers(404)
                 self.wfile.write(
-                    json.dumps({"success": False, "error": error_msg}).encode()
+                    _dumps({"success": False, "error": error_msg})
                 )
                 return
 
-            print(f"[DEBUG] Found template at: {template_path}")
+            if DEBUG:
+                print(f"[DEBUG] Found template at: {template_path}")
 
             # Create output directory with timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = _ts_compact()
             output_dir = os.path.join(OUTPUT_DIR, timestamp)
             os.makedirs(output_dir, exist_ok=True)
             print(f"Output directory: {output_dir}")
 
             # Process the template
-            processor = XMLTemplateProcessor(template_path, output_dir)
+            processor = XMLTemplateProcessor(template_path, output_dir, template_bytes)
             generated_files = processor.generate_test_files(test_name)
 
             # Convert to relative paths for the frontend
@@ -204,19 +439,21 @@ class SimpleHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
             }
 
             self._set_headers(200)
-            self.wfile.write(json.dumps(response).encode())
+            self.wfile.write(_dumps(response))
 
         except Exception as e:
             self.send_error(500, f"Error generating test files: {str(e)}")
 
     def handle_upload_to_mtex(self):
         """Handle MTex upload via mtex.py script"""
+        from mtex import main as mtex_main
+
         try:
             # Read request body for outputDir override
             length = int(self.headers.get("Content-Length", 0))
             if length:
-                post_data = self.rfile.read(length)
-                data = json.loads(post_data.decode())
+                post_data = self._read_body(length)
+                data = _loads(post_data)
                 output_dir_name = data.get("outputDir")
                 if not output_dir_name:
                     raise ValueError("Missing outputDir in request")
@@ -224,24 +461,29 @@ class SimpleHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
             else:
                 test_data_override = None
 
-            mtex_main(test_data_override)
+            with _AUTOMATION_LOCK:
+                mtex_main(test_data_override)
             self._set_headers(200)
             self.wfile.write(
-                json.dumps(
+                _dumps(
                     {"success": True, "message": "Upload to MTex completed"}
-                ).encode()
+                )
             )
         except Exception as ex:
             self._set_headers(500)
             err = str(ex)
-            self.wfile.write(json.dumps({"success": False, "error": err}).encode())
+            self.wfile.write(_dumps({"success": False, "error": err}))
 
     def handle_disposition_transactions(self):
         """Process transactions and snapshot pages to a screenshots folder"""
+        from mtex import main as mtex_main
+        from disposition_service import run_disposition
+        from utils.utils import ensure_dir, today_str
+
         try:
             # Read request body for outputDir and action
             length = int(self.headers.get("Content-Length", 0))
-            data = json.loads(self.rfile.read(length)) if length else {}
+            data = _loads(self._read_body(length)) if length else {}
             raw = data.get("outputDir", "")
             output_dir_name = raw
             action = data.get("action")
@@ -249,70 +491,35 @@ class SimpleHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
             if not output_dir_name or not action or not upi:
                 raise ValueError("Missing outputDir, action, or upi")
 
-            # Prepare common screenshot folder and BPM pre-check
-            # Compute screenshot folder matching disposition_service structure
-            date_folder = datetime.now().strftime("%Y-%m-%d")
-            screenshot_folder = os.path.join(OUTPUT_DIR, date_folder, upi)
-            os.makedirs(screenshot_folder, exist_ok=True)
-            with sync_playwright() as pw:
-                # browser_bpm = pw.chromium.connect_over_cdp("http://localhost:9222")
-                browser_bpm = pw.chromium.launch(channel="chrome", headless=True)
-                ctx_bpm = browser_bpm.new_context()
-                page_bpm = ctx_bpm.new_page()
-                bpm_page = BPMPage(page_bpm)
-                perform_login_and_setup(bpm_page)
-                select_options_and_submit(bpm_page, page_bpm, [Options.ENTERPRISE_ISO])
-                before_val, _ = handle_dropdown_and_search(bpm_page, page_bpm, upi)
-                pre_path = os.path.join(screenshot_folder, f"bpm_before_{upi}.png")
-                page_bpm.screenshot(path="bpm_before.png", full_page=True)
-                ctx_bpm.close()
-                browser_bpm.close()
-
-            # Run disposition
-            result = run_disposition(output_dir_name, action, upi)
-            # Run MTex to capture its screenshot into same folder
-            mtex_main(screenshot_folder)
-            # Ensure result uses our combined folder
-            result["screenshot_path"] = screenshot_folder
-
-            # BPM post-check
-            with sync_playwright() as pw2:
-                # browser_bpm2 = pw2.chromium.connect_over_cdp("http://localhost:9222")
-                browser_bpm2 = pw2.chromium.launch(channel="chrome", headless=True)
-                ctx_bpm2 = browser_bpm2.new_context()
-                page_bpm2 = ctx_bpm2.new_page()
-                bpm_page2 = BPMPage(page_bpm2)
-                perform_login_and_setup(bpm_page2)
-                select_options_and_submit(
-                    bpm_page2, page_bpm2, [Options.ENTERPRISE_ISO]
-                )
-                after_val, _ = handle_dropdown_and_search(bpm_page2, page_bpm2, upi)
-                post_path = os.path.join(screenshot_folder, f"bpm_after_{upi}.png")
-                page_bpm2.screenshot(path="bpm_after.png", full_page=True)
-                ctx_bpm2.close()
-                browser_bpm2.close()
-
-            # Generate PDF of all screenshots in folder
-            png_files = [
-                f for f in os.listdir(screenshot_folder) if f.lower().endswith(".png")
-            ]
-            png_files = sorted(
-                png_files,
-                key=lambda f: os.path.getctime(os.path.join(screenshot_folder, f)),
-            )
-            pdf_path = os.path.join(screenshot_folder, "screenshots.pdf")
-            c = canvas.Canvas(pdf_path, pagesize=landscape(A4))
-            w, h = landscape(A4)
-            for fname in png_files:
-                img_path = os.path.join(screenshot_folder, fname)
-                c.drawImage(img_path, 0, 0, width=w, height=h)
-                c.showPage()
-            c.save()
-            print(f"Generated PDF: {pdf_path}")
+            with _AUTOMATION_LOCK:
+                # Prepare common screenshot folder and BPM pre-check
+                # Compute screenshot folder matching disposition_service structure
+                date_folder = today_str()
+                screenshot_folder = os.path.join(OUTPUT_DIR, date_folder, upi)
+                ensure_dir(screenshot_folder)
+                before_val = _bpm_snapshot(upi, "before")
+
+                # Run disposition
+                result = run_disposition(output_dir_name, action, upi)
+                # Run MTex to capture its screenshot into same folder
+                mtex_main(screenshot_folder)
+                # Ensure result uses our combined folder
+                result["screenshot_path"] = screenshot_folder
+
+                # BPM post-check on a pool thread while the PDF is built here; the
+                # BPM screenshot is not written into screenshot_folder, so the two
+                # are independent. (The pre-check has to finish before the
+                # disposition, since it records the "before" state.)
+                after_future = _POOL.submit(_bpm_snapshot, upi, "after")
+
+                # Generate PDF of all screenshots in folder
+                pdf_path = _build_pdf(screenshot_folder, _sorted_screenshots(screenshot_folder))
+                print(f"Generated PDF: {pdf_path}")
+                after_val = after_future.result()
 
             self._set_headers(200)
             self.wfile.write(
-                json.dumps(
+                _dumps(
                     {
                         "success": True,
                         "screenshotsDir": screenshot_folder,
@@ -321,74 +528,125 @@ class SimpleHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
                         "bpm_after_value": after_val,
                         "pdfPath": pdf_path,
                     }
-                ).encode()
+                )
             )
         except Exception as ex:
             self._set_headers(500)
-            self.wfile.write(json.dumps({"success": False, "error": str(ex)}).encode())
+            self.wfile.write(_dumps({"success": False, "error": str(ex)}))
 
     def handle_generate_pdf(self):
-        """Generate a PDF per provided directory, saving alongside screenshots"""
+        """Start building a PDF per provided directory, saved alongside the screenshots.
+
+        Responds at once with a ``jobId`` to poll via GET /api/pdf-status;
+        with ``?wait=1`` it blocks and returns the ``pdfPaths`` directly.
+        """
         try:
             # Read and normalize screenshot directories
             length = int(self.headers.get("Content-Length", 0))
-            data = json.loads(self.rfile.read(length)) if length else {}
+            data = _loads(self._read_body(length)) if length else {}
             raw = data.get("screenshotDirs", [])
             dirs = []
             for d in raw:
                 if isinstance(d, str) and d:
-                    d2 = d.replace("\\", os.sep).replace("/", os.sep)
+                    d2 = d.translate(_SEP_TABLE)
                     d2 = d2.lstrip(os.sep)
                     dirs.append(os.path.normpath(d2))
             if not dirs:
                 raise ValueError("No screenshotDirs provided")
-            # Generate one PDF per directory
-
-            pdf_paths = []
-            for d in dirs:
-                # Locate folder
-                full_d = os.path.join(PROJECT_ROOT, d)
-                if not os.path.isdir(full_d):
-                    full_d = os.path.join(os.getcwd(), d)
-                if not os.path.isdir(full_d):
-                    continue
-                # Gather PNGs, sorted by creation time
-                files = [f for f in os.listdir(full_d) if f.lower().endswith(".png")]
-                files = sorted(
-                    files, key=lambda f: os.path.getctime(os.path.join(full_d, f))
-                )
-                if not files:
-                    continue
-                # Create PDF in same folder
-                pdf_path = os.path.join(full_d, "screenshots.pdf")
-                c = canvas.Canvas(pdf_path, pagesize=landscape(A4))
-                w, h = landscape(A4)
-                for fname in files:
-                    img_path = os.path.join(full_d, fname)
-                    c.drawImage(img_path, 0, 0, width=w, height=h)
-                    c.showPage()
-                c.save()
-                # Log PDF creation path
-                print(f"Generated PDF (generate_pdf): {pdf_path}")
-                pdf_paths.append(pdf_path)
-            if not pdf_paths:
-                raise FileNotFoundError(
-                    "No PDFs generated, directories empty or not found"
-                )
-            # Respond with generated paths
+
+            future = _PDF_POOL.submit(_build_all_pdfs, dirs)
+            if parse_qs(urlsplit(self.path).query).get("wait") == ["1"]:
+                response = {"success": True, "pdfPaths": future.result()}
+            else:
+                job_id = _add_job(future)
+                response = {"success": True, "jobId": job_id}
             self._set_headers(200)
-            self.wfile.write(
-                json.dumps({"success": True, "pdfPaths": pdf_paths}).encode()
-            )
+            self.wfile.write(_dumps(response))
+        except Exception as e:
+            self._set_headers(500)
+            self.wfile.write(_dumps({"success": False, "error": str(e)}))
+
+    def handle_pdf_status(self):
+        """Report a generate-pdf job: ``done`` plus ``pdfPaths`` once finished."""
+        job_id = parse_qs(urlsplit(self.path).query).get("jobId", [""])[0]
+        with _JOBS_LOCK:
+            entry = _JOBS.get(job_id)
+        if entry is None:
+            self._set_headers(404)
+            self.wfile.write(_dumps({"success": False, "error": "Unknown jobId"}))
+            return
+        future = entry[0]
+        if not future.done():
+            self._set_headers(200)
+            self.wfile.write(_dumps({"success": True, "done": False}))
+            return
+        with _JOBS_LOCK:
+            _JOBS.pop(job_id, None)
+        try:
+            response = {"success": True, "done": True, "pdfPaths": future.result()}
         except Exception as e:
             self._set_headers(500)
-            self.wfile.write(json.dumps({"success": False, "error": str(e)}).encode())
+            self.wfile.write(_dumps({"success": False, "done": True, "error": str(e)}))
+            return
+        self._set_headers(200)
+        self.wfile.write(_dumps(response))
 
     def log_message(self, format, *args):
         # Custom logging to avoid cluttering the console
         return
 
 
+class BoundedThreadingHTTPServer(http.server.ThreadingHTTPServer):
+    """Handle requests concurrently on a fixed-size thread pool.
+
+    A long disposition no longer blocks static files or /api/test-types. At
+    most ``max_workers`` requests run at once and ``max_queued`` more may
+    wait; beyond that new connections get an immediate 503.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+    max_workers = 16
+    max_queued = 32
+    # Room for sendfile to queue a whole static asset without stalling
+    send_buffer_size = 1 << 20
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._request_pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        self._slots = threading.BoundedSemaphore(self.max_workers + self.max_queued)
+
+    def server_bind(self):
+        # Accepted sockets inherit the listening socket's send buffer size
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.send_buffer_size)
+        super().server_bind()
+
+    def finish_request(self, request, client_address):
+        # Headers and small JSON bodies go out at once instead of waiting on Nagle
+        request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        super().finish_request(request, client_address)
+
+    def process_request(self, request, client_address):
+        if not self._slots.acquire(blocking=False):
+            try:
+                request.sendall(SERVICE_UNAVAILABLE)
+            except OSError:
+                pass
+            self.shutdown_request(request)
+            return
+        self._request_pool.submit(self._run_request, request, client_address)
+
+    def _run_request(self, request, client_address):
+        try:
+            self.process_request_thread(request, client_address)
+        finally:
+            self._slots.release()
+
+    def server_close(self):
+        super().server_close()
+        self._request_pool.shutdown(wait=False)
+
+
 def run_server():
     # Create necessary directories
     print(f"Project root: {PROJECT_ROOT}")
@@ -416,7 +674,7 @@ def run_server():
         f"Templates directory contents: {os.listdir(TEMPLATES_DIR) if os.path.exists(TEMPLATES_DIR) else 'Not found'}"
     )
 
-    with socketserver.TCPServer(("", PORT), SimpleHTTPRequestHandler) as httpd:
+    with BoundedThreadingHTTPServer(("", PORT), SimpleHTTPRequestHandler) as httpd:
         print(f"\nServing at http://localhost:{PORT}")
         print(f"Open http://localhost:{PORT}/tests-automation.html in your browser")
         print("Press Ctrl+C to stop the server\n")
@@ -1,9 +1,77 @@
+import io
 import os
+import re
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
-import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape
+
+try:
+    from lxml import etree as ET  # faster C parser for the template check
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+# "{name}" placeholders in the template text
+_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+# Markup of the template. Only character data directly inside an element
+# (ElementTree's .text, which skips comments and PIs and includes CDATA) has
+# its placeholders replaced; attributes, comments, PIs and tails are copied
+# as they are
+_MARKUP_RE = re.compile(
+    r"<!--.*?-->"
+    r"|<\?.*?\?>"
+    r"|<!\[CDATA\[(?P<cdata>.*?)\]\]>"
+    r"|<!DOCTYPE(?:[^\[>]|\[.*?\])*>"
+    r"|<(?P<close>/)?(?P<tag>[^\s<>/!?][^\s<>/]*)"
+    r"(?:[^<>\"']|\"[^\"]*\"|'[^']*')*?(?P<empty>/)?>",
+    re.S,
+)
+_XML_DECLARATION = "<?xml version='1.0' encoding='utf-8'?>\n"
+# One writer per action, so a run's files are written concurrently
+_WRITE_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="xml-write")
+
+
+def _split_template(text: str) -> list:
+    """Split the template around the placeholders in element text.
+
+    Returns literal template bytes at even indices and ``(name, in_cdata)``
+    placeholders at odd ones.
+    """
+    segments: list = []
+    pending: List[str] = []
+    in_text = False
+
+    def add_data(data: str, in_cdata: bool) -> None:
+        if not in_text:
+            pending.append(data)
+            return
+        for i, part in enumerate(_PLACEHOLDER_RE.split(data)):
+            if i % 2:
+                segments.append("".join(pending).encode("utf-8"))
+                pending.clear()
+                segments.append((part, in_cdata))
+            else:
+                pending.append(part)
+
+    pos = 0
+    for m in _MARKUP_RE.finditer(text):
+        add_data(text[pos:m.start()], False)
+        if m.group("cdata") is not None:
+            pending.append("<![CDATA[")
+            add_data(m.group("cdata"), True)
+            pending.append("]]>")
+        else:
+            pending.append(m.group())
+            if m.group("tag"):
+                # Text follows a start tag; after an end or empty tag it is a tail
+                in_text = not (m.group("close") or m.group("empty"))
+        pos = m.end()
+    add_data(text[pos:], False)
+    segments.append("".join(pending).encode("utf-8"))
+    return segments
+
 
 # Configure basic logging
 logging.basicConfig(
@@ -22,7 +90,12 @@ class XMLTemplateProcessor:
         )
     """
 
-    def __init__(self, template_path: str, output_dir: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        template_path: str,
+        output_dir: Optional[str] = None,
+        template_bytes: Optional[bytes] = None,
+    ) -> None:
         """
         Initialize the processor with a template file and an optional output directory.
 
@@ -30,8 +103,29 @@ class XMLTemplateProcessor:
             template_path: Path to the XML template file.
             output_dir: Directory to save generated files. If not provided,
                         a timestamped folder under 'test_data' is created.
+            template_bytes: Already-loaded template contents; when given, the
+                        template is not read from disk.
+
+        Raises:
+            ET.ParseError: If the template is not well-formed XML.
         """
         self.template_path = Path(template_path)
+        if template_bytes is None:
+            template_bytes = self.template_path.read_bytes()
+        self.template_bytes = template_bytes
+        # Checked once to fail fast on a malformed template; files are
+        # rendered from the text, without an ElementTree round-trip. Elements
+        # are cleared as they close, so no full tree is kept around.
+        try:
+            for _event, elem in ET.iterparse(io.BytesIO(template_bytes), events=("end",)):
+                elem.clear()
+        except ET.ParseError as pe:
+            logging.error("XML parse error for %s: %s", self.template_path, pe)
+            raise
+        text = template_bytes.decode("utf-8-sig")
+        if not text.startswith("<?xml"):
+            text = _XML_DECLARATION + text
+        self._segments = _split_template(text)
         if output_dir:
             self.output_dir = Path(output_dir)
         else:
@@ -60,36 +154,29 @@ class XMLTemplateProcessor:
         key = test_name.strip().lower()
 
         if key == "screening response":
-            actions = ["stp-release", "release", "block", "reject"]
-            for action in actions:
-                now = datetime.now()
-                upi = f"{now.strftime('%Y%m%d%H%M%S')}-{action}"
-                filename = f"screening_response_{action}.xml"
-                output_path = self.output_dir / filename
-
-                replacements = {"upi_timestamp": upi, "timestamp": now.isoformat()}
-                replacements.update(extra_placeholders)
-                self._generate_file(replacements, output_path)
-                generated_files.append(str(output_path))
-
+            prefix = "screening_response"
         elif key == "cuban filter":
-            actions = ["stp-release", "release", "block", "reject"]
-            for action in actions:
-                now = datetime.now()
-                upi = f"{now.strftime('%Y%m%d%H%M%S')}-{action}"
-                filename = f"cuban_filter_{action}.xml"
-                output_path = self.output_dir / filename
-
-                replacements = {"upi_timestamp": upi, "timestamp": now.isoformat()}
-                replacements.update(extra_placeholders)
-                self._generate_file(replacements, output_path)
-                generated_files.append(str(output_path))
-
+            prefix = "cuban_filter"
         else:
             msg = f"Unsupported test_name: '{test_name}'"
             logging.error(msg)
             raise ValueError(msg)
 
+        # One run: every action shares the same timestamp
+        now = datetime.now()
+        stamp = now.strftime("%Y%m%d%H%M%S")
+        iso = now.isoformat()
+        tasks = []
+        for action in ("stp-release", "release", "block", "reject"):
+            output_path = self.output_dir / f"{prefix}_{action}.xml"
+            replacements = {"upi_timestamp": f"{stamp}-{action}", "timestamp": iso}
+            replacements.update(extra_placeholders)
+            tasks.append((replacements, output_path))
+
+        # Files are independent; list() re-raises the first failure here
+        list(_WRITE_POOL.map(lambda task: self._generate_file(*task), tasks))
+        generated_files.extend(str(output_path) for _, output_path in tasks)
+
         logging.info("Generated files: %s", generated_files)
         return generated_files
 
@@ -97,30 +184,28 @@ class XMLTemplateProcessor:
         """
         Create a new XML file by applying replacements to the template.
 
+        Placeholders were located once in __init__, so this only encodes the
+        replacement values and splices them between the pre-encoded template
+        bytes; unknown placeholders are left as they are.
+
         Args:
             replacements: Mapping of placeholder keys to replacement text.
             output_path: Destination file path for the generated XML.
         """
         try:
-            tree = ET.parse(self.template_path)
-            root = tree.getroot()
-
-            # Recursively replace placeholders in element text
-            def _replace(node: ET.Element) -> None:
-                if node.text:
-                    for key, val in replacements.items():
-                        placeholder = f"{{{key}}}"
-                        if placeholder in node.text:
-                            node.text = node.text.replace(placeholder, val)
-                for child in node:
-                    _replace(child)
-
-            _replace(root)
-            tree.write(output_path, encoding="utf-8", xml_declaration=True)
+            parts = self._segments[:]
+            for i in range(1, len(parts), 2):
+                name, in_cdata = parts[i]
+                if name not in replacements:
+                    value = "{%s}" % name
+                elif in_cdata:
+                    # "]]>" would end the section early, so split it across two
+                    value = str(replacements[name]).replace("]]>", "]]]]><![CDATA[>")
+                else:
+                    value = escape(str(replacements[name]))
+                parts[i] = value.encode("utf-8")
+            Path(output_path).write_bytes(b"".join(parts))
             logging.info("File written: %s", output_path)
-        except ET.ParseError as pe:
-            logging.error("XML parse error for %s: %s", self.template_path, pe)
-            raise
         except Exception as e:
             logging.error("Error generating file %s: %s", output_path, e)
             raise
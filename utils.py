@@ -1,15 +1,20 @@
 import os
 import logging
 from datetime import datetime
+from itertools import islice
 from typing import List, Tuple, Optional
 
+# Buffer size for transaction file reads
+READ_BUFFER_SIZE = 1 << 17
+
 
 # --- Helper Functions ---
 def parse_txt_file(txt_path: str) -> Tuple[str, str, str]:
     """Parse transaction file to extract transaction, action, and user comment."""
     try:
-        with open(txt_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
+        # Only the first three lines matter; don't read past them
+        with open(txt_path, "r", encoding="utf-8", buffering=READ_BUFFER_SIZE) as f:
+            lines = list(islice(f, 3))
     except FileNotFoundError:
         logging.error("File not found: %s", txt_path)
         return "", "STP-Release", ""
@@ -80,8 +85,12 @@ def move_screenshots_to_folder(target_folder: str, source_dir: str = ".") -> Non
         logging.error("Target %s is not a directory", target_folder)
         return
 
+    # DirEntry carries the file type from readdir, so no extra stat per entry
     try:
-        files = os.listdir(source_dir)
+        with os.scandir(source_dir) as it:
+            screenshots = [
+                entry for entry in it if entry.name.endswith(".png") and entry.is_file()
+            ]
     except FileNotFoundError:
         logging.error("Source directory %s not found", source_dir)
         return
@@ -95,30 +104,28 @@ def move_screenshots_to_folder(target_folder: str, source_dir: str = ".") -> Non
         logging.error("OS error when accessing directory %s: %s", source_dir, e)
         return
 
-    for file in files:
-        if file.endswith(".png"):
-            source_path = os.path.join(source_dir, file)
-            target_path = os.path.join(target_folder, file)
-
-            try:
-                os.rename(source_path, target_path)
-                logging.info("Moved screenshot %s to %s", file, target_folder)
-            except FileNotFoundError:
-                logging.error("Screenshot file %s no longer exists", file)
-            except PermissionError:
-                logging.error("Permission denied when moving screenshot %s", file)
-            except FileExistsError:
-                logging.error(
-                    "A file with the name %s already exists in target folder", file
-                )
-            except OSError as e:
-                logging.error("OS error when moving screenshot %s: %s", file, e)
+    for entry in screenshots:
+        file = entry.name
+        try:
+            os.rename(entry.path, os.path.join(target_folder, file))
+            logging.info("Moved screenshot %s to %s", file, target_folder)
+        except FileNotFoundError:
+            logging.error("Screenshot file %s no longer exists", file)
+        except PermissionError:
+            logging.error("Permission denied when moving screenshot %s", file)
+        except FileExistsError:
+            logging.error(
+                "A file with the name %s already exists in target folder", file
+            )
+        except OSError as e:
+            logging.error("OS error when moving screenshot %s: %s", file, e)
 
 
 def get_txt_files(directory: str) -> List[str]:
     """Get all txt files in a directory."""
     try:
-        return [f for f in os.listdir(directory) if f.endswith(".txt")]
+        with os.scandir(directory) as it:
+            return [entry.name for entry in it if entry.name.endswith(".txt")]
     except FileNotFoundError:
         logging.error("Directory not found: %s", directory)
         return []
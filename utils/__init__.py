@@ -1,3 +1,13 @@
-from .utils import login_to, archive_screenshots, clear_existing_screenshots
+from .utils import login_to, archive_screenshots, clear_existing_screenshots, ensure_dir, today_str
+from .browser_pool import run_in_browser, shutdown_browser_pool, start_browser_pool
 
-__all__ = ["login_to", "archive_screenshots", "clear_existing_screenshots"]
+__all__ = [
+    "login_to",
+    "archive_screenshots",
+    "clear_existing_screenshots",
+    "ensure_dir",
+    "today_str",
+    "run_in_browser",
+    "shutdown_browser_pool",
+    "start_browser_pool",
+]
@@ -0,0 +1,114 @@
+"""Long-lived Playwright browsers shared across server requests.
+
+The sync Playwright API is bound to the thread that started it, so a single
+``Browser`` cannot be handed to arbitrary request threads. Instead a small set
+of worker threads each own one Playwright driver + Chromium instance for the
+lifetime of the process, and requests are queued to them. Every job gets a
+fresh ``BrowserContext`` so cookies/storage never leak between requests; only
+the expensive browser launch is amortised.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import queue
+import threading
+from concurrent.futures import Future
+from contextlib import suppress
+from typing import Callable, List, Optional, Tuple, TypeVar
+
+from playwright.sync_api import Page, sync_playwright
+
+T = TypeVar("T")
+
+POOL_SIZE = max(1, int(os.getenv("BROWSER_POOL_SIZE", "2")))
+
+_jobs: "queue.Queue[Optional[Tuple[Callable[[Page], object], Future]]]" = queue.Queue()
+_workers: List[threading.Thread] = []
+_start_lock = threading.Lock()
+
+
+def _launch(pw):
+    browser = pw.chromium.launch(channel="chrome", headless=True)
+    logging.info("Browser pool: launched Chromium in %s", threading.current_thread().name)
+    return browser
+
+
+def _worker() -> None:
+    pw = sync_playwright().start()
+    browser = None
+    try:
+        # Launch up front so the first request only pays for a new context
+        try:
+            browser = _launch(pw)
+        except Exception:  # pylint: disable=broad-except
+            logging.exception("Browser pool: initial launch failed; retrying on first job")
+        while True:
+            job = _jobs.get()
+            if job is None:
+                return
+            fn, fut = job
+            if not fut.set_running_or_notify_cancel():
+                continue
+            try:
+                if browser is None or not browser.is_connected():
+                    browser = _launch(pw)
+                context = browser.new_context()
+                try:
+                    fut.set_result(fn(context.new_page()))
+                finally:
+                    with suppress(Exception):
+                        context.close()
+            except BaseException as exc:  # pylint: disable=broad-except
+                fut.set_exception(exc)
+    finally:
+        if browser is not None:
+            with suppress(Exception):
+                browser.close()
+        with suppress(Exception):
+            pw.stop()
+
+
+def start_browser_pool() -> None:
+    """Start the pool workers now so their browsers launch before the first request."""
+    _ensure_started()
+
+
+def _ensure_started() -> None:
+    if _workers:
+        return
+    with _start_lock:
+        if _workers:
+            return
+        for i in range(POOL_SIZE):
+            t = threading.Thread(target=_worker, name=f"browser-pool-{i}", daemon=True)
+            t.start()
+            _workers.append(t)
+
+
+def run_in_browser(fn: Callable[[Page], T]) -> T:
+    """Run ``fn(page)`` on a pooled browser in a fresh context and return its result.
+
+    Blocks the calling thread until a pool worker has finished the job;
+    exceptions raised by ``fn`` are re-raised here.
+    """
+    _ensure_started()
+    fut: Future = Future()
+    _jobs.put((fn, fut))
+    return fut.result()
+
+
+def shutdown_browser_pool() -> None:
+    """Close all pooled browsers. Safe to call more than once."""
+    with _start_lock:
+        workers = list(_workers)
+        _workers.clear()
+    for _ in workers:
+        _jobs.put(None)
+    for t in workers:
+        t.join(timeout=10)
+
+
+atexit.register(shutdown_browser_pool)
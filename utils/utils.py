@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import logging
+import os
 import shutil
+import time
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
@@ -11,51 +13,67 @@ from playwright.sync_api import Page, expect
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
 
-def login_to(page: Page, url: str, username: str, password: str) -> bool:
+# Clears the current origin's web storage; resolves once indexedDB is purged
+_CLEAR_STORAGE_JS = """
+(() => {
+  try { localStorage.clear(); } catch (_) {}
+  try { sessionStorage.clear(); } catch (_) {}
+  if (window.indexedDB && indexedDB.databases) {
+    return indexedDB.databases().then(dbs => Promise.all(
+      dbs.map(db => indexedDB.deleteDatabase(db.name))
+    )).catch(() => {});
+  }
+  return null;
+})()
+"""
+
+
+def _open_login_page(page: Page, url: str, username: str) -> None:
+    """Clear cookies and the target origin's site storage, then load the login URL."""
+    # Clear cookies for a clean session
+    try:
+        page.context.clear_cookies()
+        logging.debug("Cleared context cookies before login.")
+    except Exception as e:
+        logging.warning("Could not clear cookies before login: %s", e)
+
+    # Navigate to the origin and clear site storage (localStorage, sessionStorage, indexedDB);
+    # the login URL may redirect to an SSO origin, whose storage is not the one to clear
+    try:
+        parsed = urlparse(url)
+        origin = f"{parsed.scheme}://{parsed.netloc}"
+        page.goto(origin)
+        page.wait_for_load_state("domcontentloaded")
+        page.evaluate(_CLEAR_STORAGE_JS)
+        logging.debug("Cleared site storage for origin %s before login.", origin)
+    except Exception as e:
+        logging.warning("Could not clear site storage before login: %s", e)
+
+    logging.debug("Logging to %s as %s.", url, username)
+    page.goto(url)
+
+
+def login_to(
+    page: Page, url: str, username: str, password: str, navigate: bool = True
+) -> bool:
     """Generic login flow
 
     Returns True on success, False on timeout or failure. Logs details.
     Clears cookies and site storage for the target origin before login.
+    With ``navigate=False`` the page must already show the login form; it is
+    filled in place, without clearing anything or loading the URL again.
     """
     try:
-        # Clear cookies for a clean session
-        try:
-            page.context.clear_cookies()
-            logging.debug("Cleared context cookies before login.")
-        except Exception as e:
-            logging.warning("Could not clear cookies before login: %s", e)
-
-        # Navigate to the origin and clear site storage (localStorage, sessionStorage, indexedDB)
-        try:
-            parsed = urlparse(url)
-            origin = f"{parsed.scheme}://{parsed.netloc}"
-            page.goto(origin)
-            page.wait_for_load_state("domcontentloaded")
-            page.evaluate(
-                """
-                (() => {
-                  try { localStorage.clear(); } catch (_) {}
-                  try { sessionStorage.clear(); } catch (_) {}
-                  if (window.indexedDB && indexedDB.databases) {
-                    return indexedDB.databases().then(dbs => Promise.all(
-                      dbs.map(db => indexedDB.deleteDatabase(db.name))
-                    )).catch(() => {});
-                  }
-                  return null;
-                })()
-                """
-            )
-            logging.debug("Cleared site storage for origin %s before login.", origin)
-        except Exception as e:
-            logging.warning("Could not clear site storage before login: %s", e)
-
-        logging.debug("Logging to %s as %s.", url, username)
-        page.goto(url)
+        if navigate:
+            _open_login_page(page, url, username)
         expect(page).to_have_title("State Street Login")
         page.fill("input[name='username']", username)
         page.fill("input[name='PASSWORD']", password)
         page.click("input[type='submit'][value='Submit']")
-        page.wait_for_load_state("networkidle")
+        # Done once the login form is gone and the next page's DOM is ready;
+        # networkidle would add at least 500 ms of enforced quiet on top
+        page.locator("input[name='PASSWORD']").wait_for(state="detached")
+        page.wait_for_load_state("domcontentloaded")
         logging.debug("We are in %s as %s.", url, username)
         return True
     except PlaywrightTimeoutError as e:
@@ -64,6 +82,28 @@ def login_to(page: Page, url: str, username: str, password: str) -> bool:
         return False
 
 
+# (date string, epoch of the next local midnight); see today_str()
+_TODAY = ("", 0.0)
+
+
+def today_str() -> str:
+    """Local date as YYYY-MM-DD, formatted once per day and then served from cache."""
+    global _TODAY
+    now = time.time()
+    today, expires = _TODAY
+    if now >= expires:
+        lt = time.localtime(now)
+        today = time.strftime("%Y-%m-%d", lt)
+        midnight = time.mktime((lt.tm_year, lt.tm_mon, lt.tm_mday + 1, 0, 0, 0, 0, 0, -1))
+        _TODAY = (today, midnight)
+    return today
+
+
+def ensure_dir(path: str) -> None:
+    """Create ``path`` and any missing parents; an existing directory is fine."""
+    os.makedirs(path, exist_ok=True)
+
+
 def archive_screenshots(transaction: str) -> Optional[Path]:
     """Move all PNG screenshots in CWD to screenshots/{date}_{transaction} and return the folder path.
 
@@ -74,10 +114,15 @@ def archive_screenshots(transaction: str) -> Optional[Path]:
     dest_dir = Path("screenshots") / f"{timestamp}_{transaction}"
     dest_dir.mkdir(parents=True, exist_ok=True)
 
+    # Same filesystem (the usual case): one rename per file. Otherwise
+    # shutil.move copies (sendfile-backed on Linux) and unlinks.
+    same_fs = os.stat(".").st_dev == os.stat(dest_dir).st_dev
+    move = os.replace if same_fs else shutil.move
+
     moved_any = False
     for png in Path(".").glob("*.png"):
         try:
-            shutil.move(str(png), dest_dir / png.name)
+            move(png, dest_dir / png.name)
             moved_any = True
         except Exception as e:  # pragma: no cover - best-effort archival
             logging.warning("Could not move %s: %s", png, e)
@@ -6,7 +6,8 @@ Usage::
 
 The script will:
 1. Parse requirements.txt to retrieve all declared run-time dependencies.
-2. Attempt to import each dependency and report any missing or
+2. Check that each dependency can be found on the import path (or, with
+   ``--deep``, actually import it) and report any missing or
    mis-configured libraries.
 3. Optionally run a lightweight Playwright sanity check (browser
    launch & close) so that we know the Playwright installation is fully
@@ -20,12 +21,21 @@ from __future__ import annotations
 
 import argparse
 import importlib
+import importlib.util
 import sys
 from pathlib import Path
 from typing import List
 
 REQ_FILE = Path(__file__).with_name("requirements.txt")
 
+# In most cases the import name is the same as the package name, but
+# sometimes they differ (e.g. *Flask-Cors* → ``flask_cors``). Known
+# special cases, keyed by lower-case package name.
+_IMPORT_NAME_MAP = {
+    "flask-cors": "flask_cors",
+    "python-dotenv": "dotenv",
+}
+
 # ------------ Utility -------------------------------------------------------
 
 
@@ -42,19 +52,13 @@ def read_requirements() -> List[str]:
             continue
         # A requirement may be pinned (pkg==x.y), allow extras (pkg[foo]==x),
         # or specify a direct URL (git+...). We just need the import name.
-        ambiguous_part = line.split("==")[0].split("[", 1)[0]
+        ambiguous_part = line.split("==", 1)[0].split("[", 1)[0]
         # For URLs like "git+https://...#egg=foo" we fallback to egg name
         if "#egg=" in ambiguous_part:
             ambiguous_part = ambiguous_part.split("#egg=")[-1]
-        # In most cases the import name is the same as package name, but
-        # sometimes they differ (e.g. *Flask-Cors* → ``flask_cors``). We
-        # handle the special-cases we know about, otherwise use the lower-case
-        # dash-to-underscore mapping.
-        mapping = {
-            "flask-cors": "flask_cors",
-            "python-dotenv": "dotenv",
-        }
-        import_name = mapping.get(ambiguous_part.lower(), ambiguous_part.lower().replace("-", "_"))
+        # Known special cases, otherwise the lower-case dash-to-underscore name
+        name = ambiguous_part.lower()
+        import_name = _IMPORT_NAME_MAP.get(name) or name.replace("-", "_")
         packages.append(import_name)
     return packages
 
@@ -62,17 +66,27 @@ def read_requirements() -> List[str]:
 # ------------ Main logic ----------------------------------------------------
 
 
-def run_checks(skip_playwright: bool) -> bool:
-    """Return *True* on success, *False* if any check failed."""
+def run_checks(skip_playwright: bool, deep: bool = False) -> bool:
+    """Return *True* on success, *False* if any check failed.
+
+    By default packages are only located (``find_spec``), which skips running
+    their module-level code; ``deep`` imports each one fully.
+    """
     success = True
 
     print("🔍 Verifying declared Python dependencies…\n")
     for pkg in read_requirements():
-        try:
-            importlib.import_module(pkg)
-            print(f"✅ {pkg} import ok")
-        except Exception as exc:  # pylint: disable=broad-except
-            print(f"❌ Failed to import '{pkg}': {exc}")
+        if deep:
+            try:
+                importlib.import_module(pkg)
+                print(f"✅ {pkg} import ok")
+            except Exception as exc:  # pylint: disable=broad-except
+                print(f"❌ Failed to import '{pkg}': {exc}")
+                success = False
+        elif importlib.util.find_spec(pkg) is not None:
+            print(f"✅ {pkg} found")
+        else:
+            print(f"❌ Package '{pkg}' not found")
             success = False
 
     if success:
@@ -113,7 +127,12 @@ if __name__ == "__main__":
         action="store_true",
         help="Skip the Playwright browser launch test.",
     )
+    parser.add_argument(
+        "--deep",
+        action="store_true",
+        help="Fully import each dependency instead of only locating it.",
+    )
     args = parser.parse_args()
 
-    ok = run_checks(skip_playwright=args.skip_playwright)
+    ok = run_checks(skip_playwright=args.skip_playwright, deep=args.deep)
     sys.exit(0 if ok else 1)